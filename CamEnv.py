@@ -1,1298 +1,1476 @@
-#PyTrx (c) by Penelope How, Nick Hulton, Lynne Buie
-#
-#PyTrx is licensed under a MIT License.
-#
-#You should have received a copy of the license along with this
-#work. If not, see <https://choosealicense.com/licenses/mit/>.
-
-"""
-The Camera Environment module contains the object-constructors and functions 
-for: (1) Representing a camera model in three-dimensional space; and (2) 
-Effective translation of measurements in an XY image plane to XYZ real-world 
-coordinates. The projection and inverse transformation functions are based on 
-those available in the ImGRAFT toolbox for Matlab. Translations from
-ImGRAFT are noted in related script comments.              
-"""
-
-#Import PyTrx packages
-from Utilities import plotGCPs, plotCalib, plotResiduals, plotPrincipalPoint
-from FileHandler import readImg, readGCPs, readMatrixDistortion 
-from DEM import ExplicitRaster,load_DEM,voxelviewshed
-from Images import CamImage
-
-#Import other packages
-import matplotlib.pyplot as plt
-from scipy import interpolate
-from scipy import optimize
-import numpy as np
-import cv2
-import glob
-
-#------------------------------------------------------------------------------
-
-class GCPs():    
-    """A class representing the geography of the camera scene. Contains
-    ground control points, as the world and image points, the DEM data and 
-    extent, and the image the ground control points correspond to, as an 
-    Image object. 
-    
-    :param dem: The file path of the ASCII DEM
-    :type dem: str
-    :param GCPpath: The file path of the GCP text file, with a header line, and tab delimited x, y, z world coordinates and xy image on each line
-    :type GCPpath: str
-    :param imagePath: The file path of the image the GCPs correspond to
-    :type imagePath: str
-    """
-    def __init__(self, dem, GCPpath, imagePath):
-        '''Constructor to initiate the GCP object.'''                
-        #DEM handling
-        self._dem = dem
-       
-        #Get image from CamImage object
-        if imagePath!=None:
-            self._gcpImage=CamImage(imagePath)
-        
-        #Get GCP data using the readGCP function in FileHandler
-        if GCPpath!=None:
-            world, image = readGCPs(GCPpath)
-            self._gcpxyz = world
-            self._gcpuv = image                
-
-        
-    def getGCPs(self):
-        """Return the world and image GCPs."""      
-        return self._gcpxyz, self._gcpuv
-
-        
-    def getDEM(self):
-        """Return the dem object."""       
-        return self._dem
-
-    
-    def getImage(self):
-        """Return the GCP reference image."""        
-        return self._gcpImage
-
-                
-#------------------------------------------------------------------------------        
-   
-class CamCalib(object):
-    """This base class models a standard camera calibration matrix as per 
-    OpenCV, MatLab and ImGRAFT. The class uses a standard pinhole camera model, 
-    drawing on the functions within OpenCV. A scene view is formed by 
-    projecting 3D points into the image plane using a perspective 
-    transformation.         
-    The camera intrinsic matrix is defined as a 3 x 3 array: [fx,0,0][s,fy,0]
-    [cx,cy,1], where fx and fy is the camera focal length (in pixel units) and 
-    cx and cy as the location of the image centre (in pixels too), s is the 
-    skew, and cx and cy are the image dimensions in pixels.        
-    In addition, the radial distortion and tangential distortion are 
-    represented as a series of coefficients. These distortions are introduced 
-    by discrepancies in the camera lens and between the lens and the camera 
-    sensor: 1) Radial Distortion Coefficients: k ([k1,k2,k3,k4,k5,k6]), between 
-    2 and 6 coefficients needed; and 2) Tangential Distortion Coefficients: 
-    p ([p1,p2])
-    The object can be initiated directly either as a list of three elements for 
-    each of the intrinsic, tangential and radial arrays, or by referencing a 
-    file (.mat or .txt) containing the calibration data in a pre-designated 
-    format.
-    
-    :param args: Either a calibration text file, a series of calibration text files, a list of raw parameters, or a set of calibration images (along with calibration chessboard dimensions)
-    :type args: str 
-    """    
-    def __init__(self, *args): 
-        """Constructor to initiate the camera calibration object."""         
-        failed=False 
-            
-        #Read calibration from file
-        if isinstance(args[0],str):
-            print('\nAttempting to read camera calibs from a single file')
-            args=readMatrixDistortion(args[0])
-            args=self.checkMatrix(args)
-            if args==None:
-                failed=True
-            else:
-                self._intrMat=args[0]
-                self._tanCorr=args[1]
-                self._radCorr=args[2]
-                self._calibErr=None
-            
-
-        #Read calibration from several files                      
-        elif isinstance(args[0],list):                 
-            if args[0][0][-4:] == '.txt':
-                print('\nAttempting to read camera calibs from average over ' 
-                      'several files')
-                intrMat=[]
-                tanCorr=[]
-                radCorr=[]               
-                for item in args[0]:
-                    if isinstance(item,str):
-                        arg=readMatrixDistortion(item)
-                        arg=self.checkMatrix(arg)
-                        if arg==None:
-                            failed=True
-                            break
-                        else:
-                            intrMat.append(arg[0])
-                            tanCorr.append(arg[1])
-                            radCorr.append(arg[2])
-                    else:
-                        failed=True
-
-                self._intrMat = sum(intrMat)/len(intrMat)
-                self._tanCorr = sum(tanCorr)/len(tanCorr)
-                self._radCorr = sum(radCorr)/len(radCorr)
-                self._calibErr=None
-                
-            #Calculate calibration from images                    
-            elif args[0][0][-4:] == '.JPG' or '.PNG':
-                print ('\nAttempting to calculate camera calibs from input'
-                        + ' images')
-                calibimgs=[]
-                for i in sorted(glob.glob(args[0][0])):
-                    calibimgs.append(i)
-                    
-                arg, err = calibrateImages(calibimgs,[int(args[0][1]),
-                                           int(args[0][2])])
-                arg = self.checkMatrix(arg)
-                
-                if arg==None:
-                    failed=True
-                else:
-                    self._intrMat=arg[0]
-                    self._tanCorr=arg[1]
-                    self._radCorr=arg[2]
-                    self._calibErr=err
-            else:
-                failed=True
-        
-        #Define calibration from raw input
-        elif isinstance(args[0],tuple):
-            print ('\nAttempting to make camera calibs from raw data '
-                   + 'sequences')
-            
-            arg = self.checkMatrix([args[0][0],args[0][1],args[0][2]]) 
-            
-            self._intrMat=arg[0]
-            self._tanCorr=arg[1]
-            self._radCorr=arg[2]
-            self._calibErr=None 
-            
-        else:
-            failed=True
-                        
-            
-        if failed:
-            print('\nError creating camera calibration object' +
-                  '\nPlease check calibration specification or files')
-            return None
-            
-        self._focLen=[self._intrMat[0,0], self._intrMat[1,1]]       
-        self._camCen=[self._intrMat[2,0], self._intrMat[2,1]] 
-        self._intrMatCV2=None
-                
-            
-    def getCalibdata(self):
-        """Return camera matrix, and tangential and radial distortion 
-        coefficients.
-        """
-        return self._intrMat, self._tanCorr, self._radCorr
-
-        
-    def getCamMatrix(self):
-        """Return camera matrix.
-        """
-        return self._intrMat
-
-    
-    def getDistortCoeffsCV2(self):
-        """Return radial and tangential distortion coefficients.
-        """
-        #Returns certain number of values depending on number of coefficients
-        #inputted  
-        if len(self._radCorr)==2:
-            return np.append(self._radCorr[0:2], self._tanCorr)
-        else:
-            return np.append(np.append(self._radCorr[0:2], self._tanCorr),
-                             self._radCorr[2:])
-
-        
-    def getCamMatrixCV2(self):
-        """Return camera matrix in a structure that is compatible with 
-        subsequent photogrammetric processing using OpenCV. 
-        """
-        if self._intrMatCV2 is None:
-            
-            # Transpose if 0's are not in correct places
-            if (self._intrMat[2,0]!=0 and self._intrMat[2,1]!=0 and 
-                self._intrMat[0,2]==0 and self._intrMat[1,2]==0):
-                self._intrMatCV2 = self._intrMat.transpose()
-            else:
-                self._intrMatCV2=self._intrMat[:]
-                
-            # Set 0's and 1's in the correct locations
-            it=np.array([[0,1],[1,0],[2,0],[2,1]])                 
-            for i in range(4):
-                x = it[i,0]
-                y = it[i,1]
-                self._intrMatCV2[x,y]=0.        
-            self._intrMatCV2[2,2]=1. 
-    
-        return self._intrMatCV2
-
-        
-    def reportCalibData(self):
-        """Self reporter for Camera Calibration object data."""
-        print('\nDATA FROM CAMERA CALIBRATION OBJECT')
-        print('Intrinsic Matrix:')
-        for row in self._intrMat:
-            print(str(row[0]) + str(row[1]) + str(row[2]))
-        print('\nTangential Correction:')
-        print(str(self._tanCorr))
-        print('\nRadial Correction:')
-        print(str(self._radCorr))
-        print('\nFocal Length:')
-        print(str(self._focLen))
-        print('\nCamera Centre:')
-        print(str(self._camCen))
-        if self._calibErr != None:
-            print('\nCalibration Error:')
-            print(str(self._calibErr))
-
-
-    def checkMatrix(self, matrix):
-        """Function to support the calibrate function. Checks and converts the 
-        intrinsic matrix to the correct format for calibration with opencv.
-        
-        :param matrix: Intrinsic camera matrix
-        :type matrix: arr
-        :returns: The object's intrinsic matrix (checked), tangential distortion and radial distortion information
-        :rtype: list
-        """  
-        ###This is moved over from readfile. Need to check calibration matrices
-        if matrix==None:
-            return None
-                
-        #Check matrix
-        intrMat=matrix[0]
-        
-        #Check tangential distortion coefficients
-        tanDis=np.zeros(2)
-        td = np.array(matrix[1])
-        tanDis[:td.size] = td
-        
-        #Check radial distortion coefficients
-        radDis=np.zeros(6)
-        rd = np.array(matrix[2]) 
-        radDis[:rd.size] = rd
-           
-        return intrMat, tanDis, radDis
-
-                          
-#------------------------------------------------------------------------------
-                          
-class CamEnv(CamCalib):    
-    """A class to represent the camera object, containing the intrinsic
-    matrix, distortion parameters and camera pose (position and direction).    
-    Also inherits from the :class:`PyTrx.CamEnv.CamCalib` object, representing 
-    the intrinsic camera information.
-    This object can be initialised either through an environment file (and
-    passed to the initialiser as a filepath), or with the set intput parameters
-    
-    :param name: The reference name for the camera
-    :type name: str
-    :param GCPpath: The file path of the GCPs, for the GCPs object
-    :type GCPpath: str
-    :param DEMpath: The file path for the DEM, for the GCPs object
-    :type DEMpath: str    
-    :param imagePath: The file path for the GCP reference image, for the GCPs object
-    :type imagePath: str 
-    :param calibPath: The file path for the calibration file. This can be either as a .mat Matlab file or a text file. The text file should be of the following tab delimited format: RadialDistortion [k1 k2 k3...k7], TangentialDistortion [p1 p2], IntrinsicMatrix [x y z][x y z][x y z], End
-    :type calibPath: str
-    :param coords: The x,y,z coordinates of the camera location, as a list
-    :type coords: list   
-    :param ypr: The yaw, pitch and roll of the camera, as a list
-    :type ypr: list
-    """   
-    def __init__(self, envFile):
-        """Constructor to initiate Camera Environment object.""" 
-        print('\nINITIALISING CAMERA ENVIRONMENT')
- 
-        #Read camera environment from text file        
-        if isinstance(envFile, str):
-            #Read parameters from the environment file 
-            params = self.dataFromFile(envFile)
-    
-            #Exit programme if file is invalid
-            if params==False:
-                print('\nUnable to define camera environment')
-                pass
-            
-            #Extract input files from camera environment file 
-            else:
-                (name, GCPpath, DEMpath, imagePath, 
-                 calibPath, coords, ypr, DEMdensify) = params           
-
-        #Read camera environment from files as input variables
-        elif isinstance(envFile, list):
-            name = envFile[0]
-            GCPpath = envFile[1]
-            DEMpath = envFile[2]
-            imagePath = envFile[3]
-            calibPath = envFile[4]
-            coords = envFile[5]
-            ypr = envFile[6]
-            DEMdensify = envFile[7]
-
-        else:
-            print('\nInvalid camera environment data type')
-            pass
-            
-        #Set up object parameters
-        self._name = name
-        self._camloc = np.array(coords)
-        self._DEMpath = DEMpath        
-        self._DEMdensify = DEMdensify
-        self._GCPpath = GCPpath
-        self._imagePath = imagePath
-        self._refImage = CamImage(imagePath) 
-
-        #Set yaw, pitch and roll to 0 if no information is given        
-        if ypr is None:
-            self._camDirection = np.array([0,0,0])
-        else:
-            self._camDirection =  np.array(ypr)
-
-        #Initialise CamCalib object for calibration information        
-        self._calibPath=calibPath
-        CamCalib.__init__(self,calibPath)                
-                
-        #Leave DEM and inverse projection variables empty to begin with
-        self._DEM = None
-        self._invProjVars = None
-      
-        #Initialise GCPs object for GCP and DEM information
-        if (self._GCPpath!=None and self._imagePath!=None):
-            print('\nCreating GCP environment')
-            self._gcp=GCPs(self._DEM, self._GCPpath, self._imagePath)        
-        
-       
-    def dataFromFile(self, filename):
-        """Read CamEnv data from .txt file containing keywords and filepaths
-        to associated data.
-        
-        :param filename: Environment file path
-        :type filename: str
-        :returns: Camera environment information (name, GCP filepath, DEM filepath, image filepath, calibration file path, camera coordinates, camera pose (ypr) and DEM densification factor)
-        :rtype: list
-        """
-        #Define keywords to search for in file        
-        self.key_labels={'name':'camera_environment_name',
-                         'GCPpath':'gcp_path',
-                         'DEMpath':'dem_path',
-                         'imagePath':'image_path',
-                         'calibPath':'calibration_path',
-                         'coords':'camera_location',
-                         'ypr':'yaw_pitch_roll',
-                         'DEMdensify':'dem_densification'}
-        key_lines=dict(self.key_labels)
-        for key in key_lines:
-            key_lines.update({key:None})
-        
-        #Extract all lines in the specification file                       
-#        f=filename.open() 
-        f=open(filename)
-        lines=f.readlines()
-        f.close()
-        
-        #Search for keywords and identify which line they are in       
-        for i in range(len(lines)):
-            stripped=lines[i].split("#")[0].strip().lower().replace(" ","")
-            for key in self.key_labels:
-                if self.key_labels[key]==stripped:
-                    key_lines.update({key:i})
-        
-        #Define CamEnv name if information is present in .txt file
-        lineNo=key_lines["name"]
-        if lineNo!=None:
-            name = self.__getFileDataLine__(lines,lineNo)
-        else:
-            print('\nName not supplied in: ' + str(filename))              
-            return False
-
-        #Define GCPpath if information is present in .txt file
-        lineNo=key_lines["GCPpath"]
-        if lineNo!=None:
-            GCPpath = self.__getFileDataLine__(lines,lineNo)
-        else:
-            print('\nGCPpath not supplied in: ' + str(filename))              
-            GCPpath=None
-            
-        #Define DEMpath if information is present in .txt file
-        lineNo=key_lines["DEMpath"]
-        if lineNo!=None:
-            DEMpath = self.__getFileDataLine__(lines,lineNo)
-        else:
-            print('\nDEMpath not supplied in: ' + str(filename))              
-            return False
-            
-        #Define imagePath if information is present in .txt file
-        lineNo=key_lines["imagePath"]
-        if lineNo!=None:
-            imagePath = self.__getFileDataLine__(lines,lineNo)
-        else:
-            print('\nimagePath not supplied in: ' + str(filename))              
-            return False 
-
-        #Define DEM densification specifications (DEMdensify)          
-        lineNo=key_lines["DEMdensify"]
-        if lineNo!=None:
-            DEMdensify = self.__getFileDataLine__(lines,lineNo)
-            DEMdensify = int(DEMdensify)
-        else:
-            print('\nDem densification level not supplied in: ' 
-                  + str(filename))  
-            print('Setting to 1 (No densification)')
-            DEMdensify=1
-
-        #Define calibPath if information is present in .txt file
-        lineNo=key_lines["calibPath"]
-        if lineNo!=None:
-            calibPath = self.__getFileDataLine__(lines,lineNo)            
-            fields = calibPath.strip('[]').split(',')
-            calibPath = []
-            for f in fields:
-                calibPath.append(f)
-            if len(calibPath) == 1:
-                calibPath = calibPath[0]              
-        else:
-            print('\ncalibPath not supplied in: ' + str(filename))             
-            return False   
-
-        #Define camera location coordinates (coords)
-        lineNo=key_lines["coords"]
-        if lineNo!=None:
-            coords = self.__getFileDataLine__(lines,lineNo)
-            fields = coords.strip('[]').split()    
-            coords = []
-            for f in fields:
-                coords.append(float(f)) 
-        else:
-            print('\nCoordinates not supplied in: ' + str(filename))              
-            return False 
-
-        #Define yaw, pitch, roll if information is present in .txt file
-        lineNo=key_lines["ypr"]
-        if lineNo!=None:
-            ypr = self.__getFileDataLine__(lines,lineNo)           
-            fields = ypr.strip('[]').split()
-            ypr = []
-            for f in fields:
-                ypr.append(float(f)) 
-        else:
-            print('\nYPR not supplied in: ' + str(filename))              
-            return False
-           
-        return name,GCPpath,DEMpath,imagePath,calibPath,coords,ypr,DEMdensify
-
-
-    def optimiseCamEnv(self, optimise, optmethod='trf', show=False):
-        """Optimise projection variables in the camera environment. The precise 
-        parameters to optimise are defined by the optimise variable.
-        
-        :param optimise: Parameters to optimise - 'YPR' (optimise camera pose only), 'EXT' (optimise external camera parameters), 'INT' (optimise internal camera parameters), or 'ALL' (optimise all projection parameters)
-        :type optimise: str
-        :param optmethod: Optimisation method, default to 'trf'
-        :type optmethod: str, optional
-        :param show: Flag to denote if optimisation output should be plotted, default to False
-        :type show: bool, optional
-        """
-        #Get GCPs
-        xyz, uv = self._gcp.getGCPs()
-
-        #Get camera environment parameters
-        projvars = [self._camloc, self._camDirection, self._radCorr, 
-                    self._tanCorr, self._focLen, self._camCen, self._refImage]
-        
-        opt_projvars = optimiseCamera(optimise, projvars, xyz, uv, 
-                                      optmethod, show)
-        
-        self._camloc = opt_projvars[0] 
-        self._camDirection = opt_projvars[1] 
-        self._radCorr = opt_projvars[2] 
-        self._tanCorr = opt_projvars[3]
-        self._focLen = opt_projvars[4] 
-        self._camCen = opt_projvars[5] 
-        self._refImage = opt_projvars[6]
-
-    
-    def __getFileDataLine__(self, lines, lineNo):
-        """Return a data line from the Camera Environment Specification file.
-        
-        :param lines: Line string
-        :type lines: str
-        :param lineNo: Line number
-        :type lineNo: int
-        :returns: Data line
-        :rtype: str
-        """
-        return lines[lineNo+1].split('#')[0].strip()
-
-        
-    def getRefImageSize(self):
-        """Return the dimensions of the reference image.
-        
-        :returns: Image size
-        :rtype: arr
-        """
-        return self._refImage.getImageSize()
-      
-        
-    def getDEM(self):
-        """Return DEM as :class:`PyTrx.DEM.ExplicitRaster` object.
-        
-        :returns: DEM object
-        :rtype: :class:`PyTrx.DEM.ExplicitRaster`
-        """
-        if self._DEM is None:
-            dem = load_DEM(self._DEMpath)
-            if self._DEMdensify>1:
-                dem=dem.densify(self._DEMdensify)
-            self._DEM=dem
-            return self._DEM
-        
-        else:
-            return self._DEM
-
-
-    def showGCPs(self):
-        """Plot GCPs in image plane and DEM scene."""
-        xyz, uv = self._gcp.getGCPs()               #Get GCP positions
-        dem = self.getDEM()                         #Get DEM        
-        refimage=self._refImage
-        img = refimage.getImageArray()              #Get image array
-        imn = refimage.getImageName()               #Get image name
-
-        #Plot GCPs
-        plotGCPs([xyz,uv], img, imn, dem, self._camloc, extent=None)            
-
-
-    def showPrincipalPoint(self):
-        """Plot Principal Point on reference image."""
-        refimage=self._refImage
-        img = refimage.getImageArray()              #Get image array
-        imn = refimage.getImageName()               #Get image name
-        
-        #Plot principal point 
-        plotPrincipalPoint(self._camCen, img, imn)
-
-
-    def showCalib(self):
-        """Plot corrected and uncorrected reference image."""
-        refimage=self._refImage
-        img = refimage.getImageArray()              #Get image array
-        imn = refimage.getImageName()               #Get image name        
-        matrix = self.getCamMatrixCV2()             #Get camera matrix
-        distort = self.getDistortCoeffsCV2()        #Get distortion parameters
-
-        #Plot calibrated image
-        plotCalib(matrix, distort, img, imn)       
-
-
-    def showResiduals(self):
-        """Show positions of xyz GCPs and projected GCPs, and residual 
-        differences between their positions. This can be used as a measure of
-        a error in the georectification of measurements.
-        """        
-        xyz, uv = self._gcp.getGCPs()               #Get GCPs
-        dem = self.getDEM()                         #Get DEM
-
-        #Set inverse projection parameters
-        invprojvars = setProjection(dem, self._camloc, self._camDirection, 
-                                    self._radCorr, self._tanCorr, self._focLen, 
-                                    self._camCen, self._refImage)
-        
-        #Compute residuals
-        computeResidualsXYZ(invprojvars, xyz, uv, dem)
-
-
-    def reportCamData(self):
-        """Reporter for testing that the relevant data has been successfully 
-        imported. Testing for camera Environment name, camera location (xyz),
-        reference image, DEM, DEM densification, GCPs, yaw pitch roll, camera 
-        matrix, and distortion coefficients.
-        """ 
-        #Camera name and location
-        print('\nCAMERA ENVIRONMENT REPORT')
-        print('Camera Environment name: ' + str(self._name)) 
-        print('Camera Location [X,Y,Z]: ' + str(self._camloc))
-        
-        #Reference image
-        print('\nReference image used for baseline homography ' + 
-              'and/or GCP control:')
-        print(str(self._imagePath))
-        
-        #DEM and densification        
-        print('\nDEM file used for projection:')
-        print(str(self._DEMpath))
-        if self._DEMdensify==1:
-            print('DEM is used at original resolution')
-        else:
-            print('DEM is resampled at '+ str(self._DEMdensify) + 
-                  ' times resolution')
-        
-        #GCPs        
-        if self._GCPpath!=None:
-            print('\nGCP file used to define camera pose:')
-            print(str(self._GCPpath))
-        else:
-            print('No GCP file defined')
-         
-        #Yaw, pitch, roll
-        if self._camDirection is None:
-            print('\nCamera pose assumed unset (zero values)')
-        else:
-            print('\nCamera pose set as [Yaw,Pitch,Roll]: ')
-            print(str(self._camDirection))
-
-        #Camera calibration (matrix and distortion coefficients)
-        if isinstance(self._calibPath[0],list):
-            if self._calibPath[0][0][-4:] == '.txt':
-                print('\nCalibration calculated from multiple files:')
-                print(str(self._calibPath))
-
-        elif isinstance(self._calibPath[0],str):
-            if self._calibPath[0][-4:] == '.txt':
-                print('\nCalibration calculated from single file:')
-                print(str(self._calibPath))
-                
-            elif self._calibPath[0][0][-4:] == '.JPG' or '.PNG':
-                print('\nCalibration calculated from raw images:')                    
-                print(str(self._calibPath))
-                                         
-        elif isinstance(self._calibPath[0],np.array):   
-            print('\nCalibration calculated from raw data:')
-            print(str(self._calibPath))
-        
-        else:
-            print('\nCalibration undefined')
-        
-        
-        #Report raster DEM details from the DEM class
-        if isinstance(self._DEM,ExplicitRaster):
-            print('\nDEM set:')
-            self._DEM.reportDEM()
-
-        #Report calibration parameters from CamCalib class
-        self.reportCalibData()
-
-
-def calibrateImages(imageFiles, xy, refine=None):
-    """Function for calibrating a camera from a set of input calibration
-    images. Calibration is performed using OpenCV's chessboard calibration 
-    functions. Input images (imageFile) need to be of a chessboard with 
-    regular dimensions and a known number of corner features (xy).   
-    Please note that OpenCV's calibrateCamera function is incompatible 
-    between different versions of OpenCV. Included here is the function
-    for version 3. Please see OpenCV's documentation for older versions.
-       
-    :param imageFiles: List of image file names
-    :type imageFiles: list
-    :param xy: Chessboard corner dimensions [rows, columns]
-    :type xy: list)           
-    :param refine: OpenCV camera model refinement method - cv2.CALIB_FIX_PRINCIPAL_POINT (fix principal point), cv2.CALIB_FIX_ASPECT_RATIO (Fix aspect ratio), cv2.CALIB_FIX_FOCAL_LENGTH (Fix focal length), cv2.CALIB_FIX_INTRINSIC (Fix camera model), cv2.CALIB_FIX_K1...6 (Fix radial coefficient 1-6), cv2.CALIB_FIX_TANGENT_DIST (Fix tangential coefficients), cv2.CALIB_USE_INTRINSIC_GUESS (Use initial intrinsic values), cv2.CALIB_ZERO_TANGENT_DIST (Set tangential distortion coefficients to zero), cv2.CALIB_RATIONAL_MODEL (Calculate radial distortion coefficients k4, k5, and k6). Default to None
-    :type refine: int, optional
-    :returns: A list containing the camera intrinsic matrix (arr), and tangential (arr) and radial distortion coefficents (arr), and the Camera calibration error (int)
-    :rtype: arr/int
-    """   
-    #Define shape of array
-    objp = np.zeros((xy[0]*xy[1],3), np.float32)           
-    objp[:,:2] = np.mgrid[0:xy[1],0:xy[0]].T.reshape(-1,2) 
-
-    #Array to store object pts and img pts from all images
-    objpoints = []                                   
-    imgpoints = []                                   
-    
-    #Set image counter for loop
-    imageCount = 0
-    
-    #Loop to determine if each image contains a chessboard pattern and 
-    #store corner values if it does
-    for fname in imageFiles:
-        
-        #Read file as an image using OpenCV
-        img = cv2.imread(fname)   
-
-        #Change RGB values to grayscale             
-        gray = cv2.cvtColor(img,cv2.COLOR_BGR2GRAY)    
-        
-        #Find chessboard corners in image
-        patternFound, corners = cv2.findChessboardCorners(gray,
-                                                          (xy[1],xy[0]),
-                                                          None)
-        
-        #Cycle through images, print if chessboard corners have been found 
-        #for each image
-        imageCount += 1
-        print(str(imageCount) + ': ' + str(patternFound) + ' ' + fname)
-        
-        #If found, append object points to objp array
-        if patternFound == True:
-            objpoints.append(objp)
-            
-            #Determine chessboard corners to subpixel accuracy
-            #Inputs: winSize specified 11x11, zeroZone is nothing (-1,-1), 
-            #opencv criteria
-            cv2.cornerSubPix(gray,corners,(11,11),(-1,-1),
-                             (cv2.TERM_CRITERIA_EPS+cv2.TERM_CRITERIA_MAX_ITER,
-                             30,0.001))
-                             
-            imgpoints.append(corners)
-            
-            #Draw and display corners
-            cv2.drawChessboardCorners(img,(xy[1],xy[0]),corners,
-                                      patternFound)
-
-    #Calculate initial camera matrix and distortion
-    err,mtx,dist,rvecs,tvecs = cv2.calibrateCamera(objpoints,
-                                                   imgpoints,
-                                                   gray.shape[::-1],
-                                                   None,
-                                                   5)
-    
-    #Optimise camera matrix and distortion using fixed principal point
-    if refine != None:
-        err,mtx,dist,rvecs,tvecs = cv2.calibrateCamera(objpoints,
-                                                       imgpoints,
-                                                       gray.shape[::-1],
-                                                       mtx,
-                                                       5,
-                                                       flags=refine)                                                                   
-
-    #Change matrix structure for compatibility with PyTrx
-    mtx = np.array([mtx[0][0],mtx[0][1],0,
-                   0,mtx[1][1],0,
-                   mtx[0][2],mtx[1][2],1]).reshape(3,3)
-
-    
-    #Restructure distortion parameters for compatibility with PyTrx
-    rad = np.array([dist[0],dist[1],dist[4], 0.0, 0.0, 0.0]).reshape(6)
-    tan = np.array(dist[2:4]).reshape(2)
-    
-    #Return matrix, radial distortion and tangential distortion parameters
-    return [mtx, tan, rad], err
-        
-
-def constructDEM(dempath, densefactor):
-    """Construct DEM from a given file path and densification factor.
-    
-    :param dempath: DEM filepath
-    :type dempath: str
-    :param densefactor: Densification factor
-    :type densefactor: int
-    """
-    #Prepare DEM from file
-    dem=load_DEM(dempath)
-        
-    #DEM densification
-    if densefactor>1:
-        dem=dem.densify(densefactor)
-            
-    return dem
-
-            
-def setProjection(dem, camloc, camdir, radial, tangen, foclen, camcen, refimg,
-                  viewshed=True):
-    """Set the inverse projection variables.
-    
-    :param dem: DEM object
-    :type dem: :class:`PyTrx.DEM.ExplicitRaster`
-    :param camloc: Camera location (X,Y,Z)
-    :type camloc: arr
-    :param camdir: Camera pose [yaw, pitch, roll]
-    :type camdir: arr               
-    :param radial: Radial distortion coefficients
-    :type radial: arr
-    :param tangen: Tangential distortion coefficients
-    :type tangen: arr
-    :param foclen: Camera focal length
-    :type foclen: arr
-    :param camcen: Camera principal point
-    :type camcen: arr
-    :param refimg: Reference image (function only uses the image dimensions)
-    :type refimg: arr
-    :param viewshed: Flag to denote if viewshed from camera should be determined before projection
-    :type viewshed: bool
-    :returns: Inverse projection coefficients [X,Y,Z,uv0]
-    :rtype: list
-    """             
-    print('\nSetting inverse projection coefficients')
-
-    if isinstance(dem, list):
-        dem=constructDEM(dem[0], dem[1])
-        X=dem.getData(0)
-        Y=dem.getData(1)
-        Z=dem.getData(2)        
-    else:    
-        X=dem.getData(0)
-        Y=dem.getData(1)
-        Z=dem.getData(2)
-    
-    #Define visible extent of the DEM from the location of the camera
-    if viewshed is True:
-        visible=voxelviewshed(dem, camloc)
-        XYZ=np.column_stack([X[visible[:]],Y[visible[:]],Z[visible[:]]])
-    else:
-        X=np.ravel(X)
-        Y=np.ravel(Y)
-        Z=np.ravel(Z)
-        XYZ=np.column_stack([X,Y,Z])
-        
-    #Snap image plane to DEM extent
-    uv0,dummy,inframe=projectXYZ(camloc, camdir, radial, tangen, foclen, 
-                                 camcen, refimg, XYZ)
-    uv0=np.column_stack([uv0,XYZ])
-    uv0=uv0[inframe,:]
-
-    #Assign real-world XYZ coordinates to image pixel coordinates         
-    X=uv0[:,2]
-    Y=uv0[:,3]
-    Z=uv0[:,4]
-    uv0=uv0[:,0:2]
-    
-    #Set inverse projection variables
-    print('\nInverse projection coefficients defined')
-    invProjVars=[X,Y,Z,uv0]              
-    return invProjVars
-            
-
-def projectXYZ(camloc, camdirection, radial, tangen, foclen, camcen, refimg, 
-               xyz):
-    """Project the xyz world coordinates into the corresponding image 
-    coordinates (uv). This is primarily executed using the ImGRAFT projection 
-    function found in camera.m: uv,depth,inframe=cam.project(xyz)
-    
-    :param camloc: Camera location [X,Y,Z]
-    :type camloc: arr
-    :param camdirection: Camera pose (yaw, pitch, roll)
-    :type camdirection: arr
-    :param radial: Radial distortion coefficients
-    :type radial: arr
-    :param tangen: Tangential distortion coefficients
-    :type tangen: arr               
-    :param foclen: Camera focal length
-    :type foclen: arr               
-    :param camcen: Camera principal point
-    :type camcen: arr
-    :param refimg: Reference image (function only uses the image dimensions)
-    :type refimg: arr
-    :param xyz: world coordinates            
-    :type xyz: arr     
-    :returns: Pixel coordinates in image (arr), view depth (int), and a Boolean vector containing whether each projected 3D point is inside the frame  
-    :rtype: arr/int      
-    """  
-    #This was in ImGRAFT/Matlab to transpose the input array if it's 
-    #ordered differently 
-    #if size(xyz,2)>3                                                 (MAT)
-    #   xyz=xyz';                                                     (MAT)
-    #end                                                              (MAT)
-    #xyz=bsxfun(@minus,xyz,cam.xyz);                                  (MAT)
-    ###need to check xyz is an array of the correct size
-    ###this does element-wise subtraction on the array columns
-    
-    #Get camera location
-    xyz=xyz-camloc
-    
-    #Get camera rotation matrix from pose 
-    if camdirection.ndim == 1:
-        Rprime=np.transpose(getRotation(camdirection))
-    
-    #Assign Rprime if camdirection variable is already a rotation matrix
-    elif camdirection.ndim == 2:
-        Rprime = camdirection
-    
-    #Multiply matrix
-    xyz=np.dot(xyz,Rprime)
-    
-    #ImGRAFT/Matlab equiv to below command: 
-    #xy=bsxfun(@rdivide,xyz(:,1:2),xyz(:,3))                          (MAT)
-    xy=xyz[:,0:2]/xyz[:,2:3]
-                
-    if False:
-        #Transposed from ImGRAFT
-        r2=np.sum(xy*xy,1)                
-        r2[r2>4]=4
-        
-        #Transposed from ImGRAFT
-        if not np.allclose(radial[2:6], [0., 0., 0., 0.]):
-            a=(1.+radial[0]*r2+radial[1]*r2*r2+radial[2]*r2*r2*r2)
-            a=a/(1.+radial[3]*r2+radial[4]*r2*r2+radial[5]*r2*r2*r2)
-        else:
-            a=(1.+radial[0]*r2+radial[1]*r2*r2+radial[2]*r2*r2*r2)
-
-        xty=xy[:,0]*xy[:,1]            
-        pt1=a*xy[:,0]+2*tangen[0]*xty+tangen[1]*(r2+2*xy[:,0]*xy[:,0])
-        pt2=a*xy[:,1]+2*tangen[0]*xty+tangen[1]*(r2+2*xy[:,1]*xy[:,1])            
-        xy=np.column_stack((pt1,pt2))
-
-    #ImGRAFT/Matlab version of code below: 
-    #uv=[cam.f[1]*xy(:,1)+cam.c(1), cam.f(2)*xy(:,2)+cam.c(2)];       (MAT)
-    uv=np.empty([xy.shape[0],xy.shape[1]])
-               
-    for i in range(xy.shape[0]):
-        uv[i,0]=foclen[0] * xy[i,0] + camcen[0]
-        uv[i,1]=foclen[1] * xy[i,1] + camcen[1]
- 
-    for i in range(xy.shape[0]):
-        if xyz[i,2]<=0:
-            uv[i,0]=np.nan
-            uv[i,1]=np.nan
-
-    depth=xyz[:,2]
-    
-    #Create empty array representing the image
-    inframe=np.zeros(xy.shape[0],dtype=bool)
-
-    #Get size of reference image
-    if isinstance(refimg, str):
-        ims=readImg(refimg)
-        ims=ims.shape
-    elif isinstance(refimg, np.ndarray):
-        ims=refimg.shape
-    else:
-        ims=refimg.getImageSize()
-    
-    for i in range(xy.shape[0]):
-        inframe[i]=(depth[i]>0)&(uv[i,0]>=1)&(uv[i,1]>=1)
-        inframe[i]=inframe[i]&(uv[i,0]<=ims[1])&(uv[i,1]<=ims[0])
-    
-    return uv,depth,inframe
-
- 
-def projectUV(uv, invprojvars):  
-    """Inverse project image coordinates (uv) to xyz world coordinates
-    using inverse projection variables (set using setProjection function).         
-    This function is primarily adopted from the ImGRAFT projection function 
-    found in camera.m: uv,depth,inframe=cam.project(xyz)
-    
-    :param uv: Pixel coordinates in image
-    :type uv: arr
-    :param invprojvars: Inverse projection variables [X,Y,Z,uv0]
-    :type invprojvars: list       
-    :returns: World coordinates 
-    :rtype: arr
-    """                 
-    #Create empty numpy array
-    xyz=np.zeros([uv.shape[0],3])
-    xyz[::]=float('NaN')
-    
-    #Get XYZ real world coordinates and corresponding uv coordinates
-    X=invprojvars[0]
-    Y=invprojvars[1]
-    Z=invprojvars[2]
-    uv0=invprojvars[3]
-    
-    #Snap uv and xyz grids together
-    xi=interpolate.griddata(uv0, X, uv, method='linear')
-    yi=interpolate.griddata(uv0, Y, uv, method='linear')
-    zi=interpolate.griddata(uv0, Z, uv, method='linear')
-    
-    #Return xyz grids                
-    xyz=np.column_stack([xi,yi,zi])       
-    return xyz
-
-
-def optimiseCamera(optimise, projvars, GCPxyz, GCPuv, optmethod='trf', 
-                   show=False):
-    """Optimise camera parameters using the pixel differences between a set
-    of image GCPs and projected XYZ GCPs. The optimisation routine adopts the
-    least_square function in scipy's optimize tools, using either the Trust 
-    Region Reflective algorithm, the dogleg algorithm or the 
-    Levenberg-Marquardt algorithm to refine a set group of projection 
-    parameters - camera pose only, the internal camera parameters (i.e. radial 
-    distortion, tangential distortion, focal length, principal point), the 
-    external camera parameters (i.e. camera location, camera pose), or all 
-    projection parameters (i.e. camera location, camera pose, radial 
-    distortion, tangential distortion, focal length, principal point).    
-    The Trust Region Reflective algorithm is generally a robust method, ideal 
-    for solving many variables (default). The Dogleg algorithm is ideal for 
-    solving few variables. The Levenberg-Margquardt algorithm is the most 
-    efficient method, ideal for solving few variables.
-    Pixel differences between a set of image GCPs and projected XYZ GCPs are
-    calculated and refined within the optimisation function, performing 
-    iterations until an optimum solution is reached. A new set of optimised 
-    projection parameters are returned.
-    
-    :param optimise: Flag denoting which variables will be optimised: YPR (camera pose only), INT (internal camera parameters), EXT (external camera parameters), LOC (all parameters except camera location), or ALL (all projection parameters)
-    :type optimise: str             
-    :param projvars: Projection parameters [camera location, camera pose, radial distortion, tangential distortion, focal length, principal point, reference image]
-    :typeprojvars: list
-    :param GCPuv: UV positions for GCPs, as shape (m, 2)
-    :type GCPuv: arr
-    :param optmethod: Optimisation method: 'trf' (Trust Region Reflective algorithm), 'dogbox' (dogleg algorithm), or 'lm' (Levenberg-Marquardt algorithm)
-    :type optmethod: str                           
-    :param show: Flag denoting whether plot of residuals should be shown
-    :type show: bool                                           .                                 
-    :returns: A list containing the optimised projection parameters. If optimisation fails then None is returned 
-    :rtype: list   
-    """   
-    #Get projectiion parameters from projvars
-    camloc, campose, radcorr, tancorr, focal, camcen, refimg = projvars
-
-    #Compute GCP residuals with original camera info
-    stable = [camloc, campose, radcorr, tancorr, focal, camcen]    
-    res0 = computeResidualsUV(None, stable, GCPxyz, GCPuv, refimg, 
-                            optimise=None)   
-    GCPxyz_proj0,depth,inframe = projectXYZ(camloc, campose, radcorr, tancorr, 
-                                           focal, camcen, refimg, GCPxyz)
-    
-    #Get variables for optimising    
-    if optimise=='YPR':
-        params = campose
-        stable = [camloc, radcorr, tancorr, focal, camcen]
-        print('Commencing optimisation of YPR')        
-    elif optimise=='INT':
-        params = np.concatenate((radcorr.flatten(), tancorr.flatten(), 
-                                 np.array(focal), np.array(camcen)))
-        stable = [camloc, campose]
-        print('Commencing optimisation of internal camera parameters')    
-    elif optimise == 'EXT':
-        params = np.concatenate((camloc, campose))
-        stable = [radcorr, tancorr, focal, camcen]
-        print('Commencing optimisation of external camera parameters')
-    else:
-        optimise='ALL'
-        params = np.concatenate((camloc, campose, radcorr.flatten(), 
-                                 tancorr.flatten(), np.array(focal), 
-                                 np.array(camcen)))               
-        stable=None
-        print('Commencing optimisation of all projection parameters')
-     
-    #Optimise, passing through the computeResiduals function for iterating
-    out = optimize.least_squares(computeResidualsUV, params, method=optmethod, 
-                                 verbose=2, 
-                                 args=(stable, GCPxyz, GCPuv, refimg, optimise))  
-
-    #If optimisation was sucessful
-    if out.success is True:
-        print('Optimisation successful')
-        
-        #Retrieve optimised parameters
-        if optimise=='YPR':
-            campose = out.x
-        elif optimise == 'INT':
-            radcorr = list(out.x[0:3])
-            tancorr = list(out.x[3:5])
-            focal = list(out.x[5:7])
-            camcen = list(out.x[7:9])        
-        elif optimise == 'EXT':
-            camloc = out.x[0:3]
-            campose = out.x[3:6]             
-        else:
-            camloc = out.x[0:3]
-            campose = out.x[3:6]
-            radcorr = list(out.x[6:9])
-            tancorr = list(out.x[9:11])
-            focal = list(out.x[11:13])
-            camcen = list(out.x[13:15]) 
-        
-        #Calculate projected GCPs with new projection parameters
-        GCPxyz_proj1, depth, inframe = projectXYZ(camloc, campose, radcorr, 
-                                                  tancorr, focal, camcen, 
-                                                  refimg, GCPxyz)   
-     
-        #Calculate new residuals
-        res1=[]
-        for i in range(len(GCPxyz_proj1)):
-            res1.append(np.sqrt((GCPxyz_proj1[i][0]-GCPuv[i][0])*
-                               (GCPxyz_proj1[i][0]-GCPuv[i][0])+
-                               (GCPxyz_proj1[i][1]-GCPuv[i][1])*
-                               (GCPxyz_proj1[i][1]-GCPuv[i][1])))
-        print('Original px residuals (average): ' + str(np.nanmean(res0)))        
-        print('Optimised px residuals (average): ' + str(np.nanmean(res1)))
-        
-        #Compile new projection parameter list
-        projvars1 = [camloc, campose, radcorr, tancorr, focal, camcen, 
-                     refimg]
-        
-        #If plotting flag is set to True
-        if show == True:
-            
-            #Get reference image
-            if isinstance(refimg, str):
-                refimg=readImg(refimg)
-                ims=refimg.shape
-            elif isinstance(refimg, np.ndarray):
-                ims=refimg.shape
-            else:
-                ims=refimg.getImageSize()
-                refimg=refimg.getImageArray()
-
-            
-            #Plot GCPs using Utilities.plotResiduals function 
-            plotResiduals(refimg, ims, GCPuv, GCPxyz_proj0, GCPxyz_proj1)
-        
-        #Return new projection parameters list        
-        return projvars1
-
-    #If optimisation failed, print statement and return none
-    else:
-        print('Optimisation failed')
-        return None     
-    
-
-def getRotation(camDirection):
-    """Calculates camera rotation matrix calculated from view 
-    direction.
-    
-    :param camDirection: Camera pose (yaw,pitch,roll)
-    :type camDirection: arr             
-    :returns: Rotation matrix as array
-    :rtype: arr
-    """
-
-    C = np.cos(camDirection) 
-    S = np.sin(camDirection)
-                
-    p=[S[2]*S[1]*C[0]-C[2]*S[0] , S[2]*S[1]*S[0] + C[2]*C[0] , S[2]*C[1]]
-    q=[C[2]*S[1]*C[0] + S[2]*S[0], C[2]*S[1]*S[0] - S[2]*C[0],C[2]*C[1]]
-    r=[C[1]*C[0] , C[1]*S[0] , -S[1]]
-        
-    value = np.array([p,q,r])
-    value[0:2,:]=-value[0:2,:]
-
-    return value
-
-
-def computeResidualsXYZ(invprojvars, GCPxyz, GCPuv, dem):
-    """Function for computing the pixel difference between GCP image points
-    and GCP projected XYZ points. This function is used in the optimisation 
-    function (optimiseCamera), with parameters for optimising defined in the
-    first variable and stable parameters defined in the second. If no 
-    optimisable parameters are given and the optimise flag is set to None then 
-    residuals are computed for the original parameters (i.e. no optimisation).
-    
-    :param params: Optimisable parameters, given as a 1-D array of shape (m, )
-    :type params: arr
-    :param stable: Stable parameters that will not be optimised
-    :type stable: list
-    :param GCPxyz: GCPs in scene space (x,y,z)
-    :type GCPxyz: arr
-    :param GCPuv: GCPs in image space (u,v)
-    :type GCPuv: arr
-    :param refimg: Reference image, given as a CamImage object, file path string, or image array
-    :type refimg: :class:`PyTrx.Images.CamImage`/str/arr
-    :param optimise: Flag denoting which variables will be optimised: YPR (camera pose only), INT (internal camera parameters), EXT (external camera parameters), LOC (all parameters except camera location), or ALL (all projection parameters)
-    :type optimise: str
-    :returns: Array denoting pixel difference between UV and projected XYZ position of each GCP
-    :rtype: arr
-    """
-    GCPxyz_proj = projectUV(GCPuv, invprojvars)  
-        
-    #Compute residuals using pythag theorem (i.e. pixel difference between pts)
-    residual=[]
-    for i in range(len(GCPxyz_proj)):
-        residual.append(np.sqrt((GCPxyz_proj[i][0]-GCPxyz[i][0])**2 + 
-                                (GCPxyz_proj[i][1]-GCPxyz[i][1])**2))  
-    residual = np.array(residual)    
-
-    fig, (ax1) = plt.subplots(1, figsize=(20,10))
-    fig.canvas.set_window_title('Average residual difference: ' + 
-                                str(np.nanmean(residual)) + ' m')
-          
-    #Plot DEM and set cmap
-    demextent = dem.getExtent()
-    demz = dem.getZ()  
-    implot = ax1.imshow(demz, origin='lower', extent=demextent)
-    implot.set_cmap('gray')
-    ax1.axis([demextent[0], demextent[1],demextent[2], demextent[3]])
-    
-    #Plot UV GCPs
-    ax1.scatter(GCPxyz[:,0], GCPxyz[:,1], color='red', marker='+', 
-                label='XYZ')
-    
-    #Plot projected XYZ GCPs
-    ax1.scatter(GCPxyz_proj[:,0], GCPxyz_proj[:,1], color='blue', 
-                marker='+', label='Projected UV')
-    
-    #Add legend and show plot
-    ax1.legend()
-    plt.show() 
-        
-    #Return all residuals
-    return residual
-   
-
-def computeResidualsUV(params, stable, GCPxyz, GCPuv, refimg, 
-                       optimise='YPR'):
-    """Function for computing the pixel difference between GCP image points
-    and GCP projected XYZ points. This function is used in the optimisation 
-    function (optimiseCamera), with parameters for optimising defined in the
-    first variable and stable parameters defined in the second. If no 
-    optimisable parameters are given and the optimise flag is set to None then 
-    residuals are computed for the original parameters (i.e. no optimisation).
-    
-    :param params: Optimisable parameters, given as a 1-D array of shape (m, )
-    :type params: arr
-    :param stable: Stable parameters that will not be optimised
-    :type stable: list
-    :param GCPxyz: GCPs in scene space (x,y,z)
-    :type GCPxyz: arr
-    :param GCPuv: GCPs in image space (u,v)
-    :type GCPuv: arr
-    :param refimg: Reference image, given as a CamImage object, file path string, or image array
-    :type refimg: :class:`PyTrx.Images.CamImage`/str/arr
-    :param optimise: Flag denoting which variables will be optimised: YPR (camera pose only), INT (internal camera parameters), EXT (external camera parameters), LOC (all parameters except camera location), or ALL (all projection parameters)
-    :type optimise: str
-    :returns: Pixel difference between UV and projected XYZ position of each GCP
-    :rtype: arr
-    """   
-    #Assign optimisable and stable parameters depending on optimise flag
-    if optimise == 'YPR':
-        campose = params      
-        camloc, radcorr, tancorr, focal, camcen = stable
-            
-    elif optimise == 'INT':
-        radcorr = params[1:3]
-        tancorr = params[3:5]
-        focal = params[5:7]
-        camcen = params[7:9]
-        camloc, campose = stable 
-    
-    elif optimise == 'EXT':
-        camloc = params[0:3]
-        campose = params[3:6]
-        radcorr, tancorr, focal, camcen = stable 
-
-    elif optimise == 'ALL':
-        camloc = params[0:3]
-        campose = params[3:6]
-        radcorr = params[6:9]
-        tancorr = params[9:11]
-        focal = params[11:13]
-        camcen = params[13:15]
-        
-    else:       
-        camloc, campose, radcorr, tancorr, focal, camcen = stable
-    
-    #Project XYZ points to UV space       
-    GCPxyz_proj,depth,inframe = projectXYZ(camloc, campose, radcorr, tancorr, 
-                                           focal, camcen, refimg, GCPxyz)
-    
-    #Compute residuals using pythag theorem (i.e. pixel difference between pts)
-    residual=[]
-    for i in range(len(GCPxyz_proj)):
-        residual.append(np.sqrt((GCPxyz_proj[i][0]-GCPuv[i][0])**2 + 
-                                (GCPxyz_proj[i][1]-GCPuv[i][1])**2))  
-    residual = np.array(residual)
-
-    #Return all residuals
-    return residual
- 
-#------------------------------------------------------------------------------
-
-#if __name__ == "__main__":   
-#    print '\nProgram finished'
-
-#------------------------------------------------------------------------------   
+#PyTrx (c) by Penelope How, Nick Hulton, Lynne Buie
+#
+#PyTrx is licensed under a MIT License.
+#
+#You should have received a copy of the license along with this
+#work. If not, see <https://choosealicense.com/licenses/mit/>.
+
+"""
+The Camera Environment module contains the object-constructors and functions 
+for: (1) Representing a camera model in three-dimensional space; and (2) 
+Effective translation of measurements in an XY image plane to XYZ real-world 
+coordinates. The projection and inverse transformation functions are based on 
+those available in the ImGRAFT toolbox for Matlab. Translations from
+ImGRAFT are noted in related script comments.              
+"""
+
+#Import PyTrx packages
+from Utilities import plotGCPs, plotCalib, plotResiduals, plotPrincipalPoint
+from FileHandler import readImg, readGCPs, readMatrixDistortion 
+from DEM import ExplicitRaster,load_DEM,voxelviewshed
+from Images import CamImage
+
+#Import other packages
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib.pyplot as plt
+from scipy import interpolate
+from scipy import optimize
+import numpy as np
+import logging
+import cv2
+import glob
+import sys
+import os
+
+#Module logger for per-image diagnostics
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------------------
+
+class GCPs():    
+    """A class representing the geography of the camera scene. Contains
+    ground control points, as the world and image points, the DEM data and 
+    extent, and the image the ground control points correspond to, as an 
+    Image object. 
+    
+    :param dem: The file path of the ASCII DEM
+    :type dem: str
+    :param GCPpath: The file path of the GCP text file, with a header line, and tab delimited x, y, z world coordinates and xy image on each line
+    :type GCPpath: str
+    :param imagePath: The file path of the image the GCPs correspond to, or an existing CamImage object for that image
+    :type imagePath: str/:class:`PyTrx.Images.CamImage`
+    """
+    def __init__(self, dem, GCPpath, imagePath):
+        '''Constructor to initiate the GCP object.'''
+        #DEM handling
+        self._dem = dem
+
+        #Get image from CamImage object. An already-constructed CamImage is
+        #adopted directly so the image is not decoded a second time
+        if imagePath is not None:
+            if isinstance(imagePath, CamImage):
+                self._gcpImage=imagePath
+            else:
+                self._gcpImage=CamImage(imagePath)
+        
+        #Get GCP data using the readGCP function in FileHandler
+        if GCPpath is not None:
+            world, image = readGCPs(GCPpath)
+            self._gcpxyz = world
+            self._gcpuv = image                
+
+        
+    def getGCPs(self):
+        """Return the world and image GCPs."""      
+        return self._gcpxyz, self._gcpuv
+
+        
+    def getDEM(self):
+        """Return the dem object."""       
+        return self._dem
+
+    
+    def getImage(self):
+        """Return the GCP reference image."""        
+        return self._gcpImage
+
+                
+#------------------------------------------------------------------------------        
+   
+class CamCalib(object):
+    """This base class models a standard camera calibration matrix as per 
+    OpenCV, MatLab and ImGRAFT. The class uses a standard pinhole camera model, 
+    drawing on the functions within OpenCV. A scene view is formed by 
+    projecting 3D points into the image plane using a perspective 
+    transformation.         
+    The camera intrinsic matrix is defined as a 3 x 3 array: [fx,0,0][s,fy,0]
+    [cx,cy,1], where fx and fy is the camera focal length (in pixel units) and 
+    cx and cy as the location of the image centre (in pixels too), s is the 
+    skew, and cx and cy are the image dimensions in pixels.        
+    In addition, the radial distortion and tangential distortion are 
+    represented as a series of coefficients. These distortions are introduced 
+    by discrepancies in the camera lens and between the lens and the camera 
+    sensor: 1) Radial Distortion Coefficients: k ([k1,k2,k3,k4,k5,k6]), between 
+    2 and 6 coefficients needed; and 2) Tangential Distortion Coefficients: 
+    p ([p1,p2])
+    The object can be initiated directly either as a list of three elements for 
+    each of the intrinsic, tangential and radial arrays, or by referencing a 
+    file (.mat or .txt) containing the calibration data in a pre-designated 
+    format.
+    
+    :param args: Either a calibration text file, a series of calibration text files, a list of raw parameters, or a set of calibration images (along with calibration chessboard dimensions)
+    :type args: str 
+    """    
+    def __init__(self, *args): 
+        """Constructor to initiate the camera calibration object."""         
+        failed=False 
+            
+        #Read calibration from file
+        if isinstance(args[0],str):
+            print('\nAttempting to read camera calibs from a single file')
+            args=readMatrixDistortion(args[0])
+            args=self.checkMatrix(args)
+            if args is None:
+                failed=True
+            else:
+                self._intrMat=args[0]
+                self._tanCorr=args[1]
+                self._radCorr=args[2]
+                self._calibErr=None
+            
+
+        #Read calibration from several files                      
+        elif isinstance(args[0],list):                 
+            if args[0][0][-4:] == '.txt':
+                print('\nAttempting to read camera calibs from average over ' 
+                      'several files')
+                intrMat=[]
+                tanCorr=[]
+                radCorr=[]
+
+                if all(isinstance(item,str) for item in args[0]):
+
+                    #Parse all calibration files in parallel; reading is
+                    #I/O bound so a thread pool overlaps the file reads
+                    with ThreadPoolExecutor() as executor:
+                        parsed = list(executor.map(readMatrixDistortion,
+                                                   args[0]))
+
+                    for arg in parsed:
+                        arg=self.checkMatrix(arg)
+                        if arg is None:
+                            failed=True
+                            break
+                        else:
+                            intrMat.append(arg[0])
+                            tanCorr.append(arg[1])
+                            radCorr.append(arg[2])
+                else:
+                    failed=True
+
+                #Average parameters over files in single vectorised passes
+                self._intrMat = np.mean(intrMat, axis=0)
+                self._tanCorr = np.mean(tanCorr, axis=0)
+                self._radCorr = np.mean(radCorr, axis=0)
+                self._calibErr=None
+                
+            #Calculate calibration from images                    
+            elif args[0][0][-4:].lower() in ('.jpg', '.png'):
+                print ('\nAttempting to calculate camera calibs from input'
+                        + ' images')
+                calibimgs=[]
+                for i in sorted(glob.glob(args[0][0])):
+                    calibimgs.append(i)
+                    
+                arg, err = calibrateImages(calibimgs,[int(args[0][1]),
+                                           int(args[0][2])])
+                arg = self.checkMatrix(arg)
+                
+                if arg is None:
+                    failed=True
+                else:
+                    self._intrMat=arg[0]
+                    self._tanCorr=arg[1]
+                    self._radCorr=arg[2]
+                    self._calibErr=err
+            else:
+                failed=True
+        
+        #Define calibration from raw input
+        elif isinstance(args[0],tuple):
+            print ('\nAttempting to make camera calibs from raw data '
+                   + 'sequences')
+            
+            arg = self.checkMatrix([args[0][0],args[0][1],args[0][2]]) 
+            
+            self._intrMat=arg[0]
+            self._tanCorr=arg[1]
+            self._radCorr=arg[2]
+            self._calibErr=None 
+            
+        else:
+            failed=True
+                        
+            
+        if failed:
+            print('\nError creating camera calibration object' +
+                  '\nPlease check calibration specification or files')
+            return None
+            
+        #Hold focal length and principal point as contiguous float arrays
+        #so projection does not convert them from lists on every call.
+        #float64 is retained as UTM-scale coordinates lose sub-metre
+        #precision in float32
+        self._focLen=np.ascontiguousarray([self._intrMat[0,0],
+                                           self._intrMat[1,1]],
+                                          dtype=np.float64)
+        self._camCen=np.ascontiguousarray([self._intrMat[2,0],
+                                           self._intrMat[2,1]],
+                                          dtype=np.float64)
+        self._intrMatCV2=None
+        self._distCoeffsCV2=None
+                
+            
+    def getCalibdata(self):
+        """Return camera matrix, and tangential and radial distortion 
+        coefficients.
+        """
+        return self._intrMat, self._tanCorr, self._radCorr
+
+        
+    def getCamMatrix(self):
+        """Return camera matrix.
+        """
+        return self._intrMat
+
+    
+    def getDistortCoeffsCV2(self):
+        """Return radial and tangential distortion coefficients.
+        """
+        #Returns certain number of values depending on number of coefficients
+        #inputted. Coefficients are packed once into a preallocated buffer
+        #and cached for subsequent calls
+        if self._distCoeffsCV2 is None:
+            coeffs = np.empty(len(self._radCorr) + len(self._tanCorr))
+            coeffs[0:2] = self._radCorr[0:2]
+            coeffs[2:4] = self._tanCorr
+            coeffs[4:] = self._radCorr[2:]
+            self._distCoeffsCV2 = coeffs
+        return self._distCoeffsCV2
+
+        
+    def getCamMatrixCV2(self):
+        """Return camera matrix in a structure that is compatible with 
+        subsequent photogrammetric processing using OpenCV. 
+        """
+        if self._intrMatCV2 is None:
+            
+            # Transpose if 0's are not in correct places. Copy so the
+            # original intrinsic matrix is left untouched
+            if (self._intrMat[2,0]!=0 and self._intrMat[2,1]!=0 and
+                self._intrMat[0,2]==0 and self._intrMat[1,2]==0):
+                self._intrMatCV2 = self._intrMat.transpose().copy()
+            else:
+                self._intrMatCV2 = self._intrMat.copy()
+
+            # Set 0's and 1's in the correct locations in a single
+            # fancy-indexed assignment
+            self._intrMatCV2[[0,1,2,2],[1,0,0,1]] = 0.
+            self._intrMatCV2[2,2] = 1.
+
+        return self._intrMatCV2
+
+        
+    def reportCalibData(self):
+        """Self reporter for Camera Calibration object data."""
+        print('\nDATA FROM CAMERA CALIBRATION OBJECT')
+        print('Intrinsic Matrix:')
+        for row in self._intrMat:
+            print(str(row[0]) + str(row[1]) + str(row[2]))
+        print('\nTangential Correction:')
+        print(str(self._tanCorr))
+        print('\nRadial Correction:')
+        print(str(self._radCorr))
+        print('\nFocal Length:')
+        print(str(self._focLen))
+        print('\nCamera Centre:')
+        print(str(self._camCen))
+        if self._calibErr is not None:
+            print('\nCalibration Error:')
+            print(str(self._calibErr))
+
+
+    def checkMatrix(self, matrix):
+        """Function to support the calibrate function. Checks and converts the 
+        intrinsic matrix to the correct format for calibration with opencv.
+        
+        :param matrix: Intrinsic camera matrix
+        :type matrix: arr
+        :returns: The object's intrinsic matrix (checked), tangential distortion and radial distortion information
+        :rtype: list
+        """  
+        ###This is moved over from readfile. Need to check calibration matrices
+        if matrix is None:
+            return None
+                
+        #Check matrix
+        intrMat=matrix[0]
+        
+        #Check tangential distortion coefficients
+        tanDis=np.zeros(2)
+        td = np.array(matrix[1])
+        tanDis[:td.size] = td
+        
+        #Check radial distortion coefficients
+        radDis=np.zeros(6)
+        rd = np.array(matrix[2]) 
+        radDis[:rd.size] = rd
+           
+        return intrMat, tanDis, radDis
+
+                          
+#------------------------------------------------------------------------------
+                          
+class CamEnv(CamCalib):    
+    """A class to represent the camera object, containing the intrinsic
+    matrix, distortion parameters and camera pose (position and direction).    
+    Also inherits from the :class:`PyTrx.CamEnv.CamCalib` object, representing 
+    the intrinsic camera information.
+    This object can be initialised either through an environment file (and
+    passed to the initialiser as a filepath), or with the set intput parameters
+    
+    :param name: The reference name for the camera
+    :type name: str
+    :param GCPpath: The file path of the GCPs, for the GCPs object
+    :type GCPpath: str
+    :param DEMpath: The file path for the DEM, for the GCPs object
+    :type DEMpath: str    
+    :param imagePath: The file path for the GCP reference image, for the GCPs object
+    :type imagePath: str 
+    :param calibPath: The file path for the calibration file. This can be either as a .mat Matlab file or a text file. The text file should be of the following tab delimited format: RadialDistortion [k1 k2 k3...k7], TangentialDistortion [p1 p2], IntrinsicMatrix [x y z][x y z][x y z], End
+    :type calibPath: str
+    :param coords: The x,y,z coordinates of the camera location, as a list
+    :type coords: list   
+    :param ypr: The yaw, pitch and roll of the camera, as a list
+    :type ypr: list
+    """   
+    def __init__(self, envFile):
+        """Constructor to initiate Camera Environment object.""" 
+        print('\nINITIALISING CAMERA ENVIRONMENT')
+ 
+        #Read camera environment from text file        
+        if isinstance(envFile, str):
+            #Read parameters from the environment file 
+            params = self.dataFromFile(envFile)
+    
+            #Exit programme if file is invalid
+            if params==False:
+                print('\nUnable to define camera environment')
+                pass
+            
+            #Extract input files from camera environment file 
+            else:
+                (name, GCPpath, DEMpath, imagePath, 
+                 calibPath, coords, ypr, DEMdensify) = params           
+
+        #Read camera environment from files as input variables
+        elif isinstance(envFile, list):
+            name = envFile[0]
+            GCPpath = envFile[1]
+            DEMpath = envFile[2]
+            imagePath = envFile[3]
+            calibPath = envFile[4]
+            coords = envFile[5]
+            ypr = envFile[6]
+            DEMdensify = envFile[7]
+
+        else:
+            print('\nInvalid camera environment data type')
+            pass
+            
+        #Set up object parameters
+        self._name = name
+        self._camloc = np.ascontiguousarray(coords, dtype=np.float64)
+        self._DEMpath = DEMpath        
+        self._DEMdensify = DEMdensify
+        self._GCPpath = GCPpath
+        self._imagePath = imagePath
+        self._refImage = CamImage(imagePath) 
+
+        #Set yaw, pitch and roll to 0 if no information is given        
+        if ypr is None:
+            self._camDirection = np.zeros(3)
+        else:
+            self._camDirection = np.ascontiguousarray(ypr, dtype=np.float64)
+
+        #Initialise CamCalib object for calibration information        
+        self._calibPath=calibPath
+        CamCalib.__init__(self,calibPath)                
+                
+        #Leave DEM, rotation matrix and inverse projection variables empty
+        #to begin with
+        self._DEM = None
+        self._camRot = None
+        self._invProjVars = None
+        self._undistMaps = None
+      
+        #Initialise GCPs object for GCP and DEM information
+        if (self._GCPpath is not None and self._imagePath is not None):
+            print('\nCreating GCP environment')
+            self._gcp=GCPs(self._DEM, self._GCPpath, self._refImage)
+        
+       
+    def dataFromFile(self, filename):
+        """Read CamEnv data from .txt file containing keywords and filepaths
+        to associated data.
+        
+        :param filename: Environment file path
+        :type filename: str
+        :returns: Camera environment information (name, GCP filepath, DEM filepath, image filepath, calibration file path, camera coordinates, camera pose (ypr) and DEM densification factor)
+        :rtype: list
+        """
+        #Define keywords to search for in file        
+        self.key_labels={'name':'camera_environment_name',
+                         'GCPpath':'gcp_path',
+                         'DEMpath':'dem_path',
+                         'imagePath':'image_path',
+                         'calibPath':'calibration_path',
+                         'coords':'camera_location',
+                         'ypr':'yaw_pitch_roll',
+                         'DEMdensify':'dem_densification'}
+        #Extract all lines in the specification file
+#        f=filename.open()
+        f=open(filename)
+        lines=f.readlines()
+        f.close()
+
+        #Strip each line once and map it to its line number, then look up
+        #each keyword directly rather than rescanning all lines per keyword
+        stripped_lines={}
+        for i in range(len(lines)):
+            stripped=lines[i].split("#")[0].strip().lower().replace(" ","")
+            stripped_lines[stripped]=i
+
+        key_lines={}
+        for key in self.key_labels:
+            key_lines[key]=stripped_lines.get(self.key_labels[key])
+        
+        #Define CamEnv name if information is present in .txt file
+        lineNo=key_lines["name"]
+        if lineNo is not None:
+            name = self.__getFileDataLine__(lines,lineNo)
+        else:
+            print('\nName not supplied in: ' + str(filename))              
+            return False
+
+        #Define GCPpath if information is present in .txt file
+        lineNo=key_lines["GCPpath"]
+        if lineNo is not None:
+            GCPpath = self.__getFileDataLine__(lines,lineNo)
+        else:
+            print('\nGCPpath not supplied in: ' + str(filename))              
+            GCPpath=None
+            
+        #Define DEMpath if information is present in .txt file
+        lineNo=key_lines["DEMpath"]
+        if lineNo is not None:
+            DEMpath = self.__getFileDataLine__(lines,lineNo)
+        else:
+            print('\nDEMpath not supplied in: ' + str(filename))              
+            return False
+            
+        #Define imagePath if information is present in .txt file
+        lineNo=key_lines["imagePath"]
+        if lineNo is not None:
+            imagePath = self.__getFileDataLine__(lines,lineNo)
+        else:
+            print('\nimagePath not supplied in: ' + str(filename))              
+            return False 
+
+        #Define DEM densification specifications (DEMdensify)          
+        lineNo=key_lines["DEMdensify"]
+        if lineNo is not None:
+            DEMdensify = self.__getFileDataLine__(lines,lineNo)
+            DEMdensify = int(DEMdensify)
+        else:
+            print('\nDem densification level not supplied in: ' 
+                  + str(filename))  
+            print('Setting to 1 (No densification)')
+            DEMdensify=1
+
+        #Define calibPath if information is present in .txt file
+        lineNo=key_lines["calibPath"]
+        if lineNo is not None:
+            calibPath = self.__getFileDataLine__(lines,lineNo)            
+            fields = calibPath.strip('[]').split(',')
+            calibPath = []
+            for f in fields:
+                calibPath.append(f)
+            if len(calibPath) == 1:
+                calibPath = calibPath[0]              
+        else:
+            print('\ncalibPath not supplied in: ' + str(filename))             
+            return False   
+
+        #Define camera location coordinates (coords)
+        lineNo=key_lines["coords"]
+        if lineNo is not None:
+            coords = self.__getFileDataLine__(lines,lineNo)
+            fields = coords.strip('[]').split()    
+            coords = []
+            for f in fields:
+                coords.append(float(f)) 
+        else:
+            print('\nCoordinates not supplied in: ' + str(filename))              
+            return False 
+
+        #Define yaw, pitch, roll if information is present in .txt file
+        lineNo=key_lines["ypr"]
+        if lineNo is not None:
+            ypr = self.__getFileDataLine__(lines,lineNo)           
+            fields = ypr.strip('[]').split()
+            ypr = []
+            for f in fields:
+                ypr.append(float(f)) 
+        else:
+            print('\nYPR not supplied in: ' + str(filename))              
+            return False
+           
+        return name,GCPpath,DEMpath,imagePath,calibPath,coords,ypr,DEMdensify
+
+
+    def optimiseCamEnv(self, optimise, optmethod='trf', show=False):
+        """Optimise projection variables in the camera environment. The precise 
+        parameters to optimise are defined by the optimise variable.
+        
+        :param optimise: Parameters to optimise - 'YPR' (optimise camera pose only), 'EXT' (optimise external camera parameters), 'INT' (optimise internal camera parameters), or 'ALL' (optimise all projection parameters)
+        :type optimise: str
+        :param optmethod: Optimisation method, default to 'trf'
+        :type optmethod: str, optional
+        :param show: Flag to denote if optimisation output should be plotted, default to False
+        :type show: bool, optional
+        """
+        #Get GCPs
+        xyz, uv = self._gcp.getGCPs()
+
+        #Get camera environment parameters
+        projvars = [self._camloc, self._camDirection, self._radCorr, 
+                    self._tanCorr, self._focLen, self._camCen, self._refImage]
+        
+        opt_projvars = optimiseCamera(optimise, projvars, xyz, uv, 
+                                      optmethod, show)
+        
+        self._camloc = opt_projvars[0] 
+        self._camDirection = opt_projvars[1] 
+        self._radCorr = opt_projvars[2] 
+        self._tanCorr = opt_projvars[3]
+        self._focLen = opt_projvars[4]
+        self._camCen = opt_projvars[5]
+        self._refImage = opt_projvars[6]
+
+        #Invalidate cached distortion coefficients, rotation matrix and
+        #inverse projection variables as the camera parameters have changed
+        self._distCoeffsCV2 = None
+        self._camRot = None
+        self._invProjVars = None
+        self._undistMaps = None
+
+    
+    def __getFileDataLine__(self, lines, lineNo):
+        """Return a data line from the Camera Environment Specification file.
+        
+        :param lines: Line string
+        :type lines: str
+        :param lineNo: Line number
+        :type lineNo: int
+        :returns: Data line
+        :rtype: str
+        """
+        return lines[lineNo+1].split('#')[0].strip()
+
+        
+    def getRefImageSize(self):
+        """Return the dimensions of the reference image.
+        
+        :returns: Image size
+        :rtype: arr
+        """
+        return self._refImage.getImageSize()
+      
+        
+    def getDEM(self):
+        """Return DEM as :class:`PyTrx.DEM.ExplicitRaster` object.
+        
+        :returns: DEM object
+        :rtype: :class:`PyTrx.DEM.ExplicitRaster`
+        """
+        if self._DEM is None:
+            dem = load_DEM(self._DEMpath)
+            if self._DEMdensify>1:
+                dem=dem.densify(self._DEMdensify)
+            self._DEM=dem
+            return self._DEM
+        
+        else:
+            return self._DEM
+
+
+    def getCamRot(self):
+        """Return the transposed camera rotation matrix, derived from the
+        camera pose (yaw, pitch, roll). The matrix is computed once and
+        cached, so repeated projection calls do not rebuild it.
+
+        :returns: Transposed rotation matrix
+        :rtype: arr
+        """
+        if self._camRot is None:
+            self._camRot = np.ascontiguousarray(
+                np.transpose(getRotation(self._camDirection)))
+        return self._camRot
+
+
+    def showGCPs(self):
+        """Plot GCPs in image plane and DEM scene."""
+        xyz, uv = self._gcp.getGCPs()               #Get GCP positions
+        dem = self.getDEM()                         #Get DEM        
+        refimage=self._refImage
+        img = refimage.getImageArray()              #Get image array
+        imn = refimage.getImageName()               #Get image name
+
+        #Plot GCPs
+        plotGCPs([xyz,uv], img, imn, dem, self._camloc, extent=None)            
+
+
+    def showPrincipalPoint(self):
+        """Plot Principal Point on reference image."""
+        refimage=self._refImage
+        img = refimage.getImageArray()              #Get image array
+        imn = refimage.getImageName()               #Get image name
+        
+        #Plot principal point 
+        plotPrincipalPoint(self._camCen, img, imn)
+
+
+    def showCalib(self):
+        """Plot corrected and uncorrected reference image."""
+        refimage=self._refImage
+        img = refimage.getImageArray()              #Get image array
+        imn = refimage.getImageName()               #Get image name
+        matrix = self.getCamMatrixCV2()             #Get camera matrix
+        distort = self.getDistortCoeffsCV2()        #Get distortion parameters
+
+        #Build the undistortion remap on the first call and cache it;
+        #cv2.undistort recomputes the full-size map on every invocation.
+        #Fixed-point CV_16SC2 maps take the fast remap lookup path
+        if self._undistMaps is None:
+            h,w = img.shape[:2]
+            newMat, roi = cv2.getOptimalNewCameraMatrix(matrix, distort,
+                                                        (w,h), 1, (w,h))
+            self._undistMaps = cv2.initUndistortRectifyMap(matrix, distort,
+                                                           None, newMat,
+                                                           (w,h),
+                                                           cv2.CV_16SC2)
+
+        #Correct image for distortion with the cached maps
+        corr_img = cv2.remap(img, self._undistMaps[0], self._undistMaps[1],
+                             cv2.INTER_LINEAR)
+
+        #Plot calibrated image
+        plotCalib(matrix, distort, img, imn, corr_image=corr_img)
+
+
+    def getInvProjVars(self):
+        """Return the inverse projection variables for the camera
+        environment, deriving them from the DEM and camera parameters on
+        first call and returning the cached set thereafter. The cache is
+        invalidated when the camera environment is optimised. The viewshed
+        and projection computations are expensive over large DEMs, so
+        repeated inverse projections should use this accessor rather than
+        calling setProjection directly.
+
+        :returns: Inverse projection variables [X,Y,Z,uv0]
+        :rtype: list
+        """
+        if self._invProjVars is None:
+            self._invProjVars = setProjection(self.getDEM(), self._camloc,
+                                              self.getCamRot(),
+                                              self._radCorr, self._tanCorr,
+                                              self._focLen, self._camCen,
+                                              self._refImage)
+        return self._invProjVars
+
+
+    def showResiduals(self):
+        """Show positions of xyz GCPs and projected GCPs, and residual
+        differences between their positions. This can be used as a measure of
+        a error in the georectification of measurements.
+        """
+        xyz, uv = self._gcp.getGCPs()               #Get GCPs
+        dem = self.getDEM()                         #Get DEM
+
+        #Set inverse projection parameters
+        invprojvars = self.getInvProjVars()
+
+        #Compute residuals
+        computeResidualsXYZ(invprojvars, xyz, uv, dem)
+
+
+    def reportCamData(self):
+        """Reporter for testing that the relevant data has been successfully 
+        imported. Testing for camera Environment name, camera location (xyz),
+        reference image, DEM, DEM densification, GCPs, yaw pitch roll, camera 
+        matrix, and distortion coefficients.
+        """ 
+        #Build the report in memory and emit it with a single write,
+        #rather than one buffered I/O call per line
+        lines=[]
+
+        #Camera name and location
+        lines.append('\nCAMERA ENVIRONMENT REPORT')
+        lines.append('Camera Environment name: ' + str(self._name))
+        lines.append('Camera Location [X,Y,Z]: ' + str(self._camloc))
+
+        #Reference image
+        lines.append('\nReference image used for baseline homography ' +
+                     'and/or GCP control:')
+        lines.append(str(self._imagePath))
+
+        #DEM and densification
+        lines.append('\nDEM file used for projection:')
+        lines.append(str(self._DEMpath))
+        if self._DEMdensify==1:
+            lines.append('DEM is used at original resolution')
+        else:
+            lines.append('DEM is resampled at '+ str(self._DEMdensify) +
+                         ' times resolution')
+
+        #GCPs
+        if self._GCPpath is not None:
+            lines.append('\nGCP file used to define camera pose:')
+            lines.append(str(self._GCPpath))
+        else:
+            lines.append('No GCP file defined')
+
+        #Yaw, pitch, roll
+        if self._camDirection is None:
+            lines.append('\nCamera pose assumed unset (zero values)')
+        else:
+            lines.append('\nCamera pose set as [Yaw,Pitch,Roll]: ')
+            lines.append(str(self._camDirection))
+
+        #Camera calibration (matrix and distortion coefficients)
+        if isinstance(self._calibPath[0],list):
+            if self._calibPath[0][0][-4:] == '.txt':
+                lines.append('\nCalibration calculated from multiple files:')
+                lines.append(str(self._calibPath))
+
+        elif isinstance(self._calibPath[0],str):
+            if self._calibPath[0][-4:] == '.txt':
+                lines.append('\nCalibration calculated from single file:')
+                lines.append(str(self._calibPath))
+
+            elif self._calibPath[0][-4:].lower() in ('.jpg', '.png'):
+                lines.append('\nCalibration calculated from raw images:')
+                lines.append(str(self._calibPath))
+
+        elif isinstance(self._calibPath[0],np.ndarray):
+            lines.append('\nCalibration calculated from raw data:')
+            lines.append(str(self._calibPath))
+
+        else:
+            lines.append('\nCalibration undefined')
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+        #Report raster DEM details from the DEM class
+        if isinstance(self._DEM,ExplicitRaster):
+            print('\nDEM set:')
+            self._DEM.reportDEM()
+
+        #Report calibration parameters from CamCalib class
+        self.reportCalibData()
+
+
+def _findImageCorners(fname, xy):
+    """Read an image from file, convert it to grayscale and search it for
+    chessboard corners. Helper for the calibrateImages function, which
+    dispatches it over a thread pool.
+
+    :param fname: Image file name
+    :type fname: str
+    :param xy: Chessboard corner dimensions [rows, columns]
+    :type xy: list
+    :returns: The grayscale image (arr), whether a chessboard pattern was found (bool), and the detected corner positions (arr)
+    :rtype: arr/bool/arr
+    """
+    #Read file as an image using OpenCV
+    img = cv2.imread(fname)
+
+    #Change RGB values to grayscale
+    gray = cv2.cvtColor(img,cv2.COLOR_BGR2GRAY)
+
+    #Find chessboard corners in image. The sector-based detector in
+    #OpenCV >= 4.0 locates corners to sub-pixel accuracy in a single pass;
+    #fall back to the legacy detector with sub-pixel refinement otherwise
+    if hasattr(cv2, 'findChessboardCornersSB'):
+        patternFound, corners = cv2.findChessboardCornersSB(
+                                        gray,
+                                        (xy[1],xy[0]),
+                                        cv2.CALIB_CB_NORMALIZE_IMAGE)
+    else:
+        patternFound, corners = cv2.findChessboardCorners(gray,
+                                                          (xy[1],xy[0]),
+                                                          None)
+
+        #Determine chessboard corners to subpixel accuracy
+        #Inputs: winSize specified 11x11, zeroZone is nothing (-1,-1),
+        #opencv criteria
+        if patternFound == True:
+            cv2.cornerSubPix(gray,corners,(11,11),(-1,-1),
+                             (cv2.TERM_CRITERIA_EPS+cv2.TERM_CRITERIA_MAX_ITER,
+                             30,0.001))
+
+    return gray, patternFound, corners
+
+
+def calibrateImages(imageFiles, xy, refine=None):
+    """Function for calibrating a camera from a set of input calibration
+    images. Calibration is performed using OpenCV's chessboard calibration 
+    functions. Input images (imageFile) need to be of a chessboard with 
+    regular dimensions and a known number of corner features (xy).   
+    Please note that OpenCV's calibrateCamera function is incompatible 
+    between different versions of OpenCV. Included here is the function
+    for version 3. Please see OpenCV's documentation for older versions.
+       
+    :param imageFiles: List of image file names
+    :type imageFiles: list
+    :param xy: Chessboard corner dimensions [rows, columns]
+    :type xy: list)           
+    :param refine: OpenCV camera model refinement method - cv2.CALIB_FIX_PRINCIPAL_POINT (fix principal point), cv2.CALIB_FIX_ASPECT_RATIO (Fix aspect ratio), cv2.CALIB_FIX_FOCAL_LENGTH (Fix focal length), cv2.CALIB_FIX_INTRINSIC (Fix camera model), cv2.CALIB_FIX_K1...6 (Fix radial coefficient 1-6), cv2.CALIB_FIX_TANGENT_DIST (Fix tangential coefficients), cv2.CALIB_USE_INTRINSIC_GUESS (Use initial intrinsic values), cv2.CALIB_ZERO_TANGENT_DIST (Set tangential distortion coefficients to zero), cv2.CALIB_RATIONAL_MODEL (Calculate radial distortion coefficients k4, k5, and k6). Default to None
+    :type refine: int, optional
+    :returns: A list containing the camera intrinsic matrix (arr), and tangential (arr) and radial distortion coefficents (arr), and the Camera calibration error (int)
+    :rtype: arr/int
+    """   
+    #Define shape of array
+    objp = np.zeros((xy[0]*xy[1],3), np.float32)           
+    objp[:,:2] = np.mgrid[0:xy[1],0:xy[0]].T.reshape(-1,2) 
+
+    #Array to store object pts and img pts from all images
+    objpoints = []
+    imgpoints = []
+
+    #Load images and search for chessboard corners in parallel. Image
+    #reading and decoding is I/O bound and OpenCV releases the GIL during
+    #corner detection, so both stages overlap across a thread pool. Results
+    #are collected in input file order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        detected = list(executor.map(lambda f: _findImageCorners(f, xy),
+                                     imageFiles))
+
+    #Set image counter for loop
+    imageCount = 0
+
+    #Loop to determine if each image contains a chessboard pattern and
+    #store corner values if it does
+    for fname, (gray, patternFound, corners) in zip(imageFiles, detected):
+
+        #Cycle through images, log if chessboard corners have been found
+        #for each image. Formatting is deferred to the logging module so
+        #it is skipped entirely when the level is disabled
+        imageCount += 1
+        logger.info('%d: %s %s', imageCount, patternFound, fname)
+
+        #If found, append object points to objp array. Corners arrive at
+        #sub-pixel accuracy from _findImageCorners
+        if patternFound == True:
+            objpoints.append(objp)
+            imgpoints.append(corners)
+
+    #Calculate initial camera matrix and distortion
+    err,mtx,dist,rvecs,tvecs = cv2.calibrateCamera(objpoints,
+                                                   imgpoints,
+                                                   gray.shape[::-1],
+                                                   None,
+                                                   5)
+    
+    #Optimise camera matrix and distortion using fixed principal point
+    if refine is not None:
+        err,mtx,dist,rvecs,tvecs = cv2.calibrateCamera(objpoints,
+                                                       imgpoints,
+                                                       gray.shape[::-1],
+                                                       mtx,
+                                                       5,
+                                                       flags=refine)                                                                   
+
+    #Change matrix structure for compatibility with PyTrx
+    mtx = np.array([mtx[0][0],mtx[0][1],0,
+                   0,mtx[1][1],0,
+                   mtx[0][2],mtx[1][2],1]).reshape(3,3)
+
+    
+    #Restructure distortion parameters for compatibility with PyTrx
+    rad = np.array([dist[0],dist[1],dist[4], 0.0, 0.0, 0.0]).reshape(6)
+    tan = np.array(dist[2:4]).reshape(2)
+    
+    #Return matrix, radial distortion and tangential distortion parameters
+    return [mtx, tan, rad], err
+        
+
+def constructDEM(dempath, densefactor):
+    """Construct DEM from a given file path and densification factor.
+    
+    :param dempath: DEM filepath
+    :type dempath: str
+    :param densefactor: Densification factor
+    :type densefactor: int
+    """
+    #Prepare DEM from file
+    dem=load_DEM(dempath)
+        
+    #DEM densification
+    if densefactor>1:
+        dem=dem.densify(densefactor)
+            
+    return dem
+
+            
+def setProjection(dem, camloc, camdir, radial, tangen, foclen, camcen, refimg,
+                  viewshed=True):
+    """Set the inverse projection variables.
+    
+    :param dem: DEM object
+    :type dem: :class:`PyTrx.DEM.ExplicitRaster`
+    :param camloc: Camera location (X,Y,Z)
+    :type camloc: arr
+    :param camdir: Camera pose [yaw, pitch, roll]
+    :type camdir: arr               
+    :param radial: Radial distortion coefficients
+    :type radial: arr
+    :param tangen: Tangential distortion coefficients
+    :type tangen: arr
+    :param foclen: Camera focal length
+    :type foclen: arr
+    :param camcen: Camera principal point
+    :type camcen: arr
+    :param refimg: Reference image (function only uses the image dimensions)
+    :type refimg: arr
+    :param viewshed: Flag to denote if viewshed from camera should be determined before projection
+    :type viewshed: bool
+    :returns: Inverse projection coefficients [X,Y,Z,uv0,interpolator]
+    :rtype: list
+    """
+    print('\nSetting inverse projection coefficients')
+
+    if isinstance(dem, list):
+        dem=constructDEM(dem[0], dem[1])
+
+    X=dem.getData(0)
+    Y=dem.getData(1)
+    Z=dem.getData(2)
+
+    #Define visible extent of the DEM from the location of the camera
+    if viewshed is True:
+        visible=voxelviewshed(dem, camloc)
+        XYZ=np.stack((X[visible], Y[visible], Z[visible]), axis=-1)
+    else:
+        XYZ=np.stack((np.ravel(X), np.ravel(Y), np.ravel(Z)), axis=-1)
+
+    #Snap image plane to DEM extent
+    uv0,dummy,inframe=projectXYZ(camloc, camdir, radial, tangen, foclen,
+                                 camcen, refimg, XYZ)
+
+    #Assign real-world XYZ coordinates to image pixel coordinates. The
+    #inframe mask is applied directly to both arrays rather than stacking
+    #them into a single wide array and splitting it again
+    XYZ=XYZ[inframe]
+    uv0=uv0[inframe]
+    X=XYZ[:,0]
+    Y=XYZ[:,1]
+    Z=XYZ[:,2]
+
+    #Build the linear interpolator up front so that every subsequent
+    #inverse projection reuses the same Delaunay triangulation of the
+    #image-plane scatter, rather than griddata re-triangulating per call.
+    #It is carried as an optional fifth element so externally-built
+    #[X,Y,Z,uv0] lists remain valid inputs to projectUV
+    interp=interpolate.LinearNDInterpolator(uv0, XYZ)
+
+    #Set inverse projection variables
+    print('\nInverse projection coefficients defined')
+    invProjVars=[X,Y,Z,uv0,interp]
+    return invProjVars
+            
+
+def _distortPoints(xy, radial, tangen):
+    """Apply the ImGRAFT radial and tangential distortion model to
+    normalised image plane coordinates. Helper for the projectXYZ function.
+
+    :param xy: Normalised image plane coordinates
+    :type xy: arr
+    :param radial: Radial distortion coefficients
+    :type radial: arr
+    :param tangen: Tangential distortion coefficients
+    :type tangen: arr
+    :returns: Distorted image plane coordinates
+    :rtype: arr
+    """
+    #Fast path: a zero-coefficient model leaves coordinates unchanged,
+    #so skip the polynomial evaluation entirely
+    if not (np.any(radial[:6]) or np.any(tangen[:2])):
+        return xy
+
+    x=xy[:,0]
+    y=xy[:,1]
+
+    #Transposed from ImGRAFT
+    r2=x*x+y*y
+    r2[r2>4]=4
+
+    #Transposed from ImGRAFT. The radial polynomials are evaluated in
+    #Horner's form with in-place ufuncs, so each polynomial reuses one
+    #buffer rather than materialising the r4 and r6 power arrays
+    a=r2*radial[2]
+    a+=radial[1]
+    a*=r2
+    a+=radial[0]
+    a*=r2
+    a+=1.
+    if not np.allclose(radial[3:6], [0., 0., 0.]):
+        d=r2*radial[5]
+        d+=radial[4]
+        d*=r2
+        d+=radial[3]
+        d*=r2
+        d+=1.
+        a/=d
+
+    #Tangential terms share the scaled cross product; the distorted
+    #coordinates are written column-wise into one preallocated array
+    xty=x*y
+    xty*=2*tangen[0]
+    out=np.empty(xy.shape)
+    out[:,0]=a*x+xty+tangen[1]*(r2+2*x*x)
+    out[:,1]=a*y+xty+tangen[1]*(r2+2*y*y)
+    return out
+
+
+def projectXYZ(camloc, camdirection, radial, tangen, foclen, camcen, refimg,
+               xyz):
+    """Project the xyz world coordinates into the corresponding image 
+    coordinates (uv). This is primarily executed using the ImGRAFT projection 
+    function found in camera.m: uv,depth,inframe=cam.project(xyz)
+    
+    :param camloc: Camera location [X,Y,Z]
+    :type camloc: arr
+    :param camdirection: Camera pose (yaw, pitch, roll)
+    :type camdirection: arr
+    :param radial: Radial distortion coefficients
+    :type radial: arr
+    :param tangen: Tangential distortion coefficients
+    :type tangen: arr               
+    :param foclen: Camera focal length
+    :type foclen: arr               
+    :param camcen: Camera principal point
+    :type camcen: arr
+    :param refimg: Reference image (function only uses the image dimensions)
+    :type refimg: arr
+    :param xyz: world coordinates            
+    :type xyz: arr     
+    :returns: Pixel coordinates in image (arr), view depth (int), and a Boolean vector containing whether each projected 3D point is inside the frame  
+    :rtype: arr/int      
+    """  
+    #This was in ImGRAFT/Matlab to transpose the input array if it's 
+    #ordered differently 
+    #if size(xyz,2)>3                                                 (MAT)
+    #   xyz=xyz';                                                     (MAT)
+    #end                                                              (MAT)
+    #xyz=bsxfun(@minus,xyz,cam.xyz);                                  (MAT)
+    ###need to check xyz is an array of the correct size
+    ###this does element-wise subtraction on the array columns
+    
+    #Accept arbitrary leading batch dimensions by flattening coordinates
+    #to (N,3); the batch shape is restored on the outputs before return
+    xyz=np.asarray(xyz)
+    lead=xyz.shape[:-1]
+    xyz=xyz.reshape(-1,3)
+
+    #Convert camera parameters once at entry. These are no-ops for the
+    #array-typed parameters held on CamEnv, and a single conversion for
+    #callers still passing lists
+    camloc=np.asarray(camloc)
+    foclen=np.asarray(foclen)
+    camcen=np.asarray(camcen)
+
+    #Get camera rotation matrix from pose. The transpose is materialised
+    #C-contiguous so the matmul below takes the BLAS fast path instead of
+    #operating on a strided view
+    if camdirection.ndim == 1:
+        Rprime=np.ascontiguousarray(np.transpose(getRotation(camdirection)))
+
+    #Assign Rprime if camdirection variable is already a rotation matrix
+    elif camdirection.ndim == 2:
+        Rprime = camdirection
+
+    #Shift to the camera location and rotate. Distributing the rotation
+    #over the subtraction rotates the camera offset once and subtracts it
+    #in place, instead of materialising a full shifted copy of xyz first
+    xyz=xyz@Rprime
+    xyz-=camloc@Rprime
+    
+    #ImGRAFT/Matlab equiv to below command: 
+    #xy=bsxfun(@rdivide,xyz(:,1:2),xyz(:,3))                          (MAT)
+    xy=xyz[:,0:2]/xyz[:,2:3]
+                
+    #Distortion is not applied here: PyTrx corrects images for lens
+    #distortion upstream, so projection operates on undistorted
+    #coordinates. The ImGRAFT distortion model is retained in the
+    #_distortPoints helper for workflows that project into raw imagery
+    #    xy=_distortPoints(xy, radial, tangen)
+
+    #ImGRAFT/Matlab version of code below:
+    #uv=[cam.f[1]*xy(:,1)+cam.c(1), cam.f(2)*xy(:,2)+cam.c(2)];       (MAT)
+    #Broadcast the focal length and principal point over all points, and
+    #blank points that project behind the camera in a single masked write
+    uv=xy*foclen+camcen
+    uv[xyz[:,2]<=0]=np.nan
+
+    depth=xyz[:,2]
+
+    #Get size of reference image
+    if isinstance(refimg, str):
+        ims=readImg(refimg)
+        ims=ims.shape
+    elif isinstance(refimg, np.ndarray):
+        ims=refimg.shape
+    else:
+        ims=refimg.getImageSize()
+
+    #Boolean vector denoting which projected points fall inside the frame.
+    #The per-axis bounds are paired so the reduction combines balanced
+    #sub-results rather than chaining five sequential passes
+    u=uv[:,0]
+    v=uv[:,1]
+    inframe=(depth>0) & ((u>=1) & (u<=ims[1])) & ((v>=1) & (v<=ims[0]))
+
+    #Restore any leading batch dimensions of the input coordinates
+    return uv.reshape(lead+(2,)),depth.reshape(lead),inframe.reshape(lead)
+
+ 
+def projectUV(uv, invprojvars):  
+    """Inverse project image coordinates (uv) to xyz world coordinates
+    using inverse projection variables (set using setProjection function).         
+    This function is primarily adopted from the ImGRAFT projection function 
+    found in camera.m: uv,depth,inframe=cam.project(xyz)
+    
+    :param uv: Pixel coordinates in image
+    :type uv: arr
+    :param invprojvars: Inverse projection variables [X,Y,Z,uv0], with an optional cached interpolator as a fifth element
+    :type invprojvars: list
+    :returns: World coordinates 
+    :rtype: arr
+    """                 
+    #Use the cached interpolator when the inverse projection variables
+    #carry one (set by setProjection), reusing its triangulation of uv0
+    if len(invprojvars)>4 and invprojvars[4] is not None:
+        return invprojvars[4](uv)
+
+    #Get XYZ real world coordinates and corresponding uv coordinates
+    X=invprojvars[0]
+    Y=invprojvars[1]
+    Z=invprojvars[2]
+    uv0=invprojvars[3]
+
+    #Snap uv and xyz grids together. Interpolating the three coordinates
+    #as one (N,3) value array means the Delaunay triangulation of uv0 is
+    #built once rather than once per coordinate
+    xyz=interpolate.griddata(uv0, np.stack((X,Y,Z), axis=-1), uv,
+                             method='linear')
+    return xyz
+
+
+def optimiseCamera(optimise, projvars, GCPxyz, GCPuv, optmethod='trf', 
+                   show=False):
+    """Optimise camera parameters using the pixel differences between a set
+    of image GCPs and projected XYZ GCPs. The optimisation routine adopts the
+    least_square function in scipy's optimize tools, using either the Trust 
+    Region Reflective algorithm, the dogleg algorithm or the 
+    Levenberg-Marquardt algorithm to refine a set group of projection 
+    parameters - camera pose only, the internal camera parameters (i.e. radial 
+    distortion, tangential distortion, focal length, principal point), the 
+    external camera parameters (i.e. camera location, camera pose), or all 
+    projection parameters (i.e. camera location, camera pose, radial 
+    distortion, tangential distortion, focal length, principal point).    
+    The Trust Region Reflective algorithm is generally a robust method, ideal 
+    for solving many variables (default). The Dogleg algorithm is ideal for 
+    solving few variables. The Levenberg-Margquardt algorithm is the most 
+    efficient method, ideal for solving few variables.
+    Pixel differences between a set of image GCPs and projected XYZ GCPs are
+    calculated and refined within the optimisation function, performing 
+    iterations until an optimum solution is reached. A new set of optimised 
+    projection parameters are returned.
+    
+    :param optimise: Flag denoting which variables will be optimised: YPR (camera pose only), INT (internal camera parameters), EXT (external camera parameters), LOC (all parameters except camera location), or ALL (all projection parameters)
+    :type optimise: str             
+    :param projvars: Projection parameters [camera location, camera pose, radial distortion, tangential distortion, focal length, principal point, reference image]
+    :typeprojvars: list
+    :param GCPuv: UV positions for GCPs, as shape (m, 2)
+    :type GCPuv: arr
+    :param optmethod: Optimisation method: 'trf' (Trust Region Reflective algorithm), 'dogbox' (dogleg algorithm), or 'lm' (Levenberg-Marquardt algorithm)
+    :type optmethod: str                           
+    :param show: Flag denoting whether plot of residuals should be shown
+    :type show: bool                                           .                                 
+    :returns: A list containing the optimised projection parameters. If optimisation fails then None is returned 
+    :rtype: list   
+    """   
+    #Get projectiion parameters from projvars
+    camloc, campose, radcorr, tancorr, focal, camcen, refimg = projvars
+
+    #Resolve a reference image filepath to its array once up front.
+    #projectXYZ only needs the image dimensions, and the optimiser calls
+    #it on every iteration, so a path string here would trigger a file
+    #read per residual evaluation
+    if isinstance(refimg, str):
+        refimg=readImg(refimg)
+
+    #Compute GCP residuals with original camera info
+    stable = [camloc, campose, radcorr, tancorr, focal, camcen]    
+    res0 = computeResidualsUV(None, stable, GCPxyz, GCPuv, refimg, 
+                            optimise=None)   
+    GCPxyz_proj0,depth,inframe = projectXYZ(camloc, campose, radcorr, tancorr, 
+                                           focal, camcen, refimg, GCPxyz)
+    
+    #Get variables for optimising    
+    if optimise=='YPR':
+        params = campose
+        stable = [camloc, radcorr, tancorr, focal, camcen]
+        print('Commencing optimisation of YPR')        
+    elif optimise=='INT':
+        params = np.concatenate((radcorr.flatten(), tancorr.flatten(), 
+                                 np.array(focal), np.array(camcen)))
+        stable = [camloc, campose]
+        print('Commencing optimisation of internal camera parameters')    
+    elif optimise == 'EXT':
+        params = np.concatenate((camloc, campose))
+        stable = [radcorr, tancorr, focal, camcen]
+        print('Commencing optimisation of external camera parameters')
+    else:
+        optimise='ALL'
+        params = np.concatenate((camloc, campose, radcorr.flatten(), 
+                                 tancorr.flatten(), np.array(focal), 
+                                 np.array(camcen)))               
+        stable=None
+        print('Commencing optimisation of all projection parameters')
+     
+    #Optimise, passing through the computeResiduals function for iterating
+    out = optimize.least_squares(computeResidualsUV, params, method=optmethod, 
+                                 verbose=2, 
+                                 args=(stable, GCPxyz, GCPuv, refimg, optimise))  
+
+    #If optimisation was sucessful
+    if out.success is True:
+        print('Optimisation successful')
+        
+        #Retrieve optimised parameters
+        if optimise=='YPR':
+            campose = out.x
+        elif optimise == 'INT':
+            radcorr = list(out.x[0:3])
+            tancorr = list(out.x[3:5])
+            focal = list(out.x[5:7])
+            camcen = list(out.x[7:9])        
+        elif optimise == 'EXT':
+            camloc = out.x[0:3]
+            campose = out.x[3:6]             
+        else:
+            camloc = out.x[0:3]
+            campose = out.x[3:6]
+            radcorr = list(out.x[6:9])
+            tancorr = list(out.x[9:11])
+            focal = list(out.x[11:13])
+            camcen = list(out.x[13:15]) 
+        
+        #Calculate projected GCPs with new projection parameters
+        GCPxyz_proj1, depth, inframe = projectXYZ(camloc, campose, radcorr, 
+                                                  tancorr, focal, camcen, 
+                                                  refimg, GCPxyz)   
+     
+        #Calculate new residuals
+        res1=np.hypot(GCPxyz_proj1[:,0]-GCPuv[:,0],
+                      GCPxyz_proj1[:,1]-GCPuv[:,1])
+        print('Original px residuals (average): ' + str(np.nanmean(res0)))        
+        print('Optimised px residuals (average): ' + str(np.nanmean(res1)))
+        
+        #Compile new projection parameter list
+        projvars1 = [camloc, campose, radcorr, tancorr, focal, camcen, 
+                     refimg]
+        
+        #If plotting flag is set to True
+        if show == True:
+            
+            #Get reference image
+            if isinstance(refimg, str):
+                refimg=readImg(refimg)
+                ims=refimg.shape
+            elif isinstance(refimg, np.ndarray):
+                ims=refimg.shape
+            else:
+                ims=refimg.getImageSize()
+                refimg=refimg.getImageArray()
+
+            
+            #Plot GCPs using Utilities.plotResiduals function 
+            plotResiduals(refimg, ims, GCPuv, GCPxyz_proj0, GCPxyz_proj1)
+        
+        #Return new projection parameters list        
+        return projvars1
+
+    #If optimisation failed, print statement and return none
+    else:
+        print('Optimisation failed')
+        return None     
+    
+
+def getRotation(camDirection):
+    """Calculates camera rotation matrix calculated from view 
+    direction.
+    
+    :param camDirection: Camera pose (yaw,pitch,roll)
+    :type camDirection: arr             
+    :returns: Rotation matrix as array
+    :rtype: arr
+    """
+
+    C = np.cos(camDirection)
+    S = np.sin(camDirection)
+
+    #Assemble the matrix directly into a preallocated array, with the
+    #sign flip of the first two rows folded into the element expressions
+    value = np.empty((3,3))
+    value[0,0] = C[2]*S[0] - S[2]*S[1]*C[0]
+    value[0,1] = -(S[2]*S[1]*S[0] + C[2]*C[0])
+    value[0,2] = -S[2]*C[1]
+    value[1,0] = -(C[2]*S[1]*C[0] + S[2]*S[0])
+    value[1,1] = S[2]*C[0] - C[2]*S[1]*S[0]
+    value[1,2] = -C[2]*C[1]
+    value[2,0] = C[1]*C[0]
+    value[2,1] = C[1]*S[0]
+    value[2,2] = -S[1]
+
+    return value
+
+
+def computeResidualsXYZ(invprojvars, GCPxyz, GCPuv, dem):
+    """Function for computing the pixel difference between GCP image points
+    and GCP projected XYZ points. This function is used in the optimisation 
+    function (optimiseCamera), with parameters for optimising defined in the
+    first variable and stable parameters defined in the second. If no 
+    optimisable parameters are given and the optimise flag is set to None then 
+    residuals are computed for the original parameters (i.e. no optimisation).
+    
+    :param params: Optimisable parameters, given as a 1-D array of shape (m, )
+    :type params: arr
+    :param stable: Stable parameters that will not be optimised
+    :type stable: list
+    :param GCPxyz: GCPs in scene space (x,y,z)
+    :type GCPxyz: arr
+    :param GCPuv: GCPs in image space (u,v)
+    :type GCPuv: arr
+    :param refimg: Reference image, given as a CamImage object, file path string, or image array
+    :type refimg: :class:`PyTrx.Images.CamImage`/str/arr
+    :param optimise: Flag denoting which variables will be optimised: YPR (camera pose only), INT (internal camera parameters), EXT (external camera parameters), LOC (all parameters except camera location), or ALL (all projection parameters)
+    :type optimise: str
+    :returns: Array denoting pixel difference between UV and projected XYZ position of each GCP
+    :rtype: arr
+    """
+    GCPxyz_proj = projectUV(GCPuv, invprojvars)  
+        
+    #Compute residuals using pythag theorem (i.e. pixel difference between pts)
+    residual = np.hypot(GCPxyz_proj[:,0]-GCPxyz[:,0],
+                        GCPxyz_proj[:,1]-GCPxyz[:,1])
+
+    fig, (ax1) = plt.subplots(1, figsize=(20,10))
+    fig.canvas.set_window_title('Average residual difference: ' + 
+                                str(np.nanmean(residual)) + ' m')
+          
+    #Plot DEM and set cmap
+    demextent = dem.getExtent()
+    demz = dem.getZ()  
+    implot = ax1.imshow(demz, origin='lower', extent=demextent)
+    implot.set_cmap('gray')
+    ax1.axis([demextent[0], demextent[1],demextent[2], demextent[3]])
+    
+    #Plot UV GCPs
+    ax1.scatter(GCPxyz[:,0], GCPxyz[:,1], color='red', marker='+', 
+                label='XYZ')
+    
+    #Plot projected XYZ GCPs
+    ax1.scatter(GCPxyz_proj[:,0], GCPxyz_proj[:,1], color='blue', 
+                marker='+', label='Projected UV')
+    
+    #Add legend and show plot
+    ax1.legend()
+    plt.show() 
+        
+    #Return all residuals
+    return residual
+   
+
+def computeResidualsUV(params, stable, GCPxyz, GCPuv, refimg, 
+                       optimise='YPR'):
+    """Function for computing the pixel difference between GCP image points
+    and GCP projected XYZ points. This function is used in the optimisation 
+    function (optimiseCamera), with parameters for optimising defined in the
+    first variable and stable parameters defined in the second. If no 
+    optimisable parameters are given and the optimise flag is set to None then 
+    residuals are computed for the original parameters (i.e. no optimisation).
+    
+    :param params: Optimisable parameters, given as a 1-D array of shape (m, )
+    :type params: arr
+    :param stable: Stable parameters that will not be optimised
+    :type stable: list
+    :param GCPxyz: GCPs in scene space (x,y,z)
+    :type GCPxyz: arr
+    :param GCPuv: GCPs in image space (u,v)
+    :type GCPuv: arr
+    :param refimg: Reference image, given as a CamImage object, file path string, or image array
+    :type refimg: :class:`PyTrx.Images.CamImage`/str/arr
+    :param optimise: Flag denoting which variables will be optimised: YPR (camera pose only), INT (internal camera parameters), EXT (external camera parameters), LOC (all parameters except camera location), or ALL (all projection parameters)
+    :type optimise: str
+    :returns: Pixel difference between UV and projected XYZ position of each GCP
+    :rtype: arr
+    """   
+    #Assign optimisable and stable parameters depending on optimise flag
+    if optimise == 'YPR':
+        campose = params      
+        camloc, radcorr, tancorr, focal, camcen = stable
+            
+    elif optimise == 'INT':
+        radcorr = params[1:3]
+        tancorr = params[3:5]
+        focal = params[5:7]
+        camcen = params[7:9]
+        camloc, campose = stable 
+    
+    elif optimise == 'EXT':
+        camloc = params[0:3]
+        campose = params[3:6]
+        radcorr, tancorr, focal, camcen = stable 
+
+    elif optimise == 'ALL':
+        camloc = params[0:3]
+        campose = params[3:6]
+        radcorr = params[6:9]
+        tancorr = params[9:11]
+        focal = params[11:13]
+        camcen = params[13:15]
+        
+    else:       
+        camloc, campose, radcorr, tancorr, focal, camcen = stable
+    
+    #Project XYZ points to UV space       
+    GCPxyz_proj,depth,inframe = projectXYZ(camloc, campose, radcorr, tancorr, 
+                                           focal, camcen, refimg, GCPxyz)
+    
+    #Compute residuals using pythag theorem (i.e. pixel difference between pts)
+    residual = np.hypot(GCPxyz_proj[:,0]-GCPuv[:,0],
+                        GCPxyz_proj[:,1]-GCPuv[:,1])
+
+    #Return all residuals
+    return residual
+ 
+#------------------------------------------------------------------------------
+
+#if __name__ == "__main__":   
+#    print '\nProgram finished'
+
+#------------------------------------------------------------------------------   
@@ -19,8 +19,9 @@ method and a grid of evenly space points in the dense method.
 #Import packages
 import numpy as np
 import cv2
-import math
-from matplotlib import path
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import matplotlib.pyplot as plt
 from scipy import interpolate
 from PIL import Image
@@ -99,62 +100,84 @@ class Homography(ImageSequence):
         #Get first image (image0) path and array data
         imn1=self._imageSet[0].getImageName()
         im1=self._imageSet[0].getImageArray()
-        
-        #Cycle through image pairs (numbered from 0)
-        for i in range(self.getLength()-1):
-            
-            #Re-assign first image in image pair
-            im0=im1
-            imn0=imn1
-            
-            #Get second image in image pair (clear memory subsequently)
-            im1=self._imageSet[i+1].getImageArray()
-            imn1=self._imageSet[i+1].getImageName()
-            self._imageSet[i].clearImage()
-            self._imageSet[i].clearImageArray()
-            
-            print('\nProcessing homograpy for images: ' + str(imn0) + ' and ' 
-                  + str(imn1))
+
+        #Prefetch upcoming images on a background thread so file reading
+        #and decoding overlap with the tracking of the current pair. The
+        #executor is shut down in all cases, including single-image
+        #sequences (where there is no pair to prefetch) and errors raised
+        #during tracking
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            if self.getLength() >= 2:
+                nextim = executor.submit(self._imageSet[1].getImageArray)
+
+            #Cycle through image pairs (numbered from 0)
+            for i in range(self.getLength()-1):
+
+                #Re-assign first image in image pair
+                im0=im1
+                imn0=imn1
+
+                #Get second image in image pair (clear memory subsequently).
+                #The decoded image buffer of the new image is also dropped
+                #immediately; im1 keeps the array alive for tracking
+                im1=nextim.result()
+                imn1=self._imageSet[i+1].getImageName()
+                self._imageSet[i].clearImage()
+                self._imageSet[i].clearImageArray()
+                self._imageSet[i+1].clearImage()
+
+                #Queue the next image while this pair is processed
+                if i+2 < self.getLength():
+                    nextim=executor.submit(self._imageSet[i+2].getImageArray)
+
+                print('\nProcessing homograpy for images: ' + str(imn0) + ' and ' 
+                      + str(imn1))
             
-            #Get inverse mask and calibration parameters
-            invmask = self.getInverseMask()
-            cameraMatrix=self._camEnv.getCamMatrixCV2()
-            distortP=self._camEnv.getDistortCoeffsCV2()
+                #Get inverse mask and calibration parameters
+                invmask = self.getInverseMask()
+                cameraMatrix=self._camEnv.getCamMatrixCV2()
+                distortP=self._camEnv.getDistortCoeffsCV2()
             
-            if params[0]=='sparse':
+                if params[0]=='sparse':
                 
-                #Calculate homography from corners 
-                hg=calcSparseHomography(im0, im1, invmask, [cameraMatrix, distortP], 
-                                        homogmethod, ransacReprojThreshold,
-                                        params[2][0], params[2][1],
-                                        params[2][2], [params[1][0],
-                                        params[1][1], params[1][2]])
+                    #Calculate homography from corners 
+                    hg=calcSparseHomography(im0, im1, invmask, [cameraMatrix, distortP],
+                                            homogmethod, ransacReprojThreshold,
+                                            params[2][0], params[2][1],
+                                            params[2][2], [params[1][0],
+                                            params[1][1], params[1][2]])
                 
-            elif params[0]=='dense':
+                elif params[0]=='dense':
                 
-                #Get camera environment 
-                camenv = self.getCamEnv()
+                    #Get camera environment 
+                    camenv = self.getCamEnv()
                 
-                #Get DEM from camera environment
-                dem = camenv.getDEM() 
-        
-                #Get projection and inverse projection variables through camera info
-                projvars = [camenv._camloc, camenv._camDirection, camenv._radCorr, 
-                            camenv._tanCorr, camenv._focLen, camenv._camCen, 
-                            camenv._refImage]
-        
-                #Calculate homography from grid
-                hg=calcDenseHomography(im0, im1, invmask, 
-                                       [cameraMatrix, distortP], params[1], 
-                                       params[2][1], params[2][2], dem, projvars, 
-                                       params[2][0], homogmethod, 
-                                       ransacReprojThreshold, params[2][3],
-                                       params[2][4])
-        
-            #Assign homography information as object attributes
-            homog.append(hg)
-            
-        return homog            
+                    #Get DEM from camera environment
+                    dem = camenv.getDEM() 
+        
+                    #Get projection and inverse projection variables through camera info
+                    projvars = [camenv._camloc, camenv._camDirection, camenv._radCorr, 
+                                camenv._tanCorr, camenv._focLen, camenv._camCen, 
+                                camenv._refImage]
+        
+                    #Calculate homography from grid
+                    hg=calcDenseHomography(im0, im1, invmask, 
+                                           [cameraMatrix, distortP], params[1], 
+                                           params[2][1], params[2][2], dem, projvars, 
+                                           params[2][0], homogmethod, 
+                                           ransacReprojThreshold, params[2][3],
+                                           params[2][4])
+        
+                #Assign homography information as object attributes, and drop
+                #the first image's array before the next pair is loaded
+                homog.append(hg)
+                del im0
+
+        finally:
+            executor.shutdown()
+
+        return homog
 
 
     def getInverseMask(self):
@@ -242,11 +265,10 @@ class Velocity(ImageSequence):
                     camenv._tanCorr, camenv._focLen, camenv._camCen, 
                     camenv._refImage]
         
-        #Get inverse projection variables through camera info               
-        invprojvars = setProjection(dem, camenv._camloc, camenv._camDirection, 
-                                    camenv._radCorr, camenv._tanCorr, 
-                                    camenv._focLen, camenv._camCen, 
-                                    camenv._refImage) 
+        #Get inverse projection variables through camera info. These are
+        #cached on the camera environment, so repeated velocity runs with
+        #the same camera do not rebuild the viewshed and projection
+        invprojvars = camenv.getInvProjVars()
         
         #Get camera matrix and distortion parameters for calibration
         mtx=self._camEnv.getCamMatrixCV2()
@@ -258,60 +280,79 @@ class Velocity(ImageSequence):
         #Get first image (image0) file path and array data for initial tracking
         imn1=self._imageSet[0].getImageName()
         im1=self._imageSet[0].getImageArray()
-        
-        #Cycle through image pairs (numbered from 0)
-        for i in range(self.getLength()-1):
-
-            #Re-assign first image in image pair
-            im0=im1
-            imn0=imn1
-                            
-            #Get second image in image pair (and subsequently clear memory)
-            im1=self._imageSet[i+1].getImageArray()
-            imn1=self._imageSet[i+1].getImageName()       
-            self._imageSet[i].clearAll()
-           
-            print('\nFeature-tracking for images: ' + str(imn0) +' and ' 
-                  + str(imn1))        
 
-            #Calculate velocities between image pair with homography
-            if self._homog is not None:
-                if params[0]=='sparse':
-                    pts=calcSparseVelocity(im0, im1, mask, [mtx,distort], 
-                                           [self._homog[i][0], 
-                                           self._homog[i][3]], 
-                                           invprojvars, params[2][0], 
-                                           params[2][1], params[2][2], 
-                                           [params[1][0], params[1][1], 
-                                           params[1][2]]) 
-                    
-                elif params[0]=='dense':
-                    pts=calcDenseVelocity(im0, im1, params[1], params[2][0],
-                                          params[2][1], params[2][2],
-                                          mask, [mtx,distort], 
-                                          [self._homog[i][0], 
-                                          self._homog[i][3]], [dem, projvars, 
-                                          invprojvars], params[2][3],
-                                          params[2][4])
-                       
-            else:
-                if params[0]=='sparse':
-                    pts=calcSparseVelocity(im0, im1, mask, [mtx,distort], 
-                                           [None, None], invprojvars, 
-                                           params[2][0], params[2][1], 
-                                           params[2][2], [params[1][0], 
-                                           params[1][1], params[1][2]])
-                        
-                elif params[0]=='dense':
-                    pts=calcDenseVelocity(im0, im1, params[1], params[2][0],
+        #Calculate the optimal camera matrix once for the whole sequence;
+        #the image dimensions and calibration are constant across pairs
+        h,w = im1.shape[:2]
+        newMat, roi = _optimalCamMatrix(mtx, distort, w, h)
+
+        #Bind the tracking method once; the sparse/dense choice and the
+        #tracking parameters are constant over the whole sequence, so the
+        #per-pair loop only supplies the pair-specific arguments
+        if params[0]=='sparse':
+            def track(im0, im1, hpair):
+                return calcSparseVelocity(im0, im1, mask, [mtx,distort],
+                                          hpair, invprojvars, params[2][0],
                                           params[2][1], params[2][2],
-                                          mask, [mtx,distort], [None, None], 
-                                          [dem, projvars, invprojvars], 
-                                          params[2][3], params[2][4])                     
+                                          [params[1][0], params[1][1],
+                                          params[1][2]], newMat=newMat)
+        else:
+            def track(im0, im1, hpair):
+                return calcDenseVelocity(im0, im1, params[1], params[2][0],
+                                         params[2][1], params[2][2],
+                                         mask, [mtx,distort], hpair,
+                                         [dem, projvars, invprojvars],
+                                         params[2][3], params[2][4],
+                                         newMat=newMat)
+
+        #Prefetch upcoming images on a background thread so file reading
+        #and decoding overlap with the tracking of the current pair. The
+        #executor is shut down in all cases, including single-image
+        #sequences (where there is no pair to prefetch) and errors raised
+        #during tracking
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            if self.getLength() >= 2:
+                nextim = executor.submit(self._imageSet[1].getImageArray)
+
+            #Cycle through image pairs (numbered from 0)
+            for i in range(self.getLength()-1):
+
+                #Re-assign first image in image pair
+                im0=im1
+                imn0=imn1
+
+                #Get second image in image pair (and subsequently clear memory).
+                #The decoded image buffer of the new image is also dropped
+                #immediately; im1 keeps the array alive for tracking
+                im1=nextim.result()
+                imn1=self._imageSet[i+1].getImageName()
+                self._imageSet[i].clearAll()
+                self._imageSet[i+1].clearImage()
+
+                #Queue the next image while this pair is processed
+                if i+2 < self.getLength():
+                    nextim=executor.submit(self._imageSet[i+2].getImageArray)
+
+                print('\nFeature-tracking for images: ' + str(imn0) +' and '
+                      + str(imn1))
+
+                #Calculate velocities between image pair, correcting for
+                #platform motion if a homography model is available
+                if self._homog is not None:
+                    hpair=[self._homog[i][0], self._homog[i][3]]
+                else:
+                    hpair=[None, None]
+                pts=track(im0, im1, hpair)
                                                  
-            #Append output
-            velocity.append(pts)         
-        
+                #Append output, and drop the first image's array before the
+                #next pair is loaded
+                velocity.append(pts)
+                del im0
+
+        finally:
+            executor.shutdown()
+
         #Return XYZ and UV velocity information
         return velocity
        
@@ -328,9 +369,10 @@ class Velocity(ImageSequence):
 
 #------------------------------------------------------------------------------    
 
-def calcSparseVelocity(img1, img2, mask, calib=None, homog=None, 
-                       invprojvars=None, winsize=(25,25), back_thresh=1.0, 
-                       min_features=4, seedparams=[50000, 0.1, 5.0]):
+def calcSparseVelocity(img1, img2, mask, calib=None, homog=None,
+                       invprojvars=None, winsize=(25,25), back_thresh=1.0,
+                       min_features=4, seedparams=[50000, 0.1, 5.0],
+                       newMat=None, prevpts=None):
     """Function to calculate the velocity between a pair of images. Points 
     are seeded in the first of these either by a defined grid spacing, or using 
     the Shi-Tomasi algorithm with OpenCV's goodFeaturesToTrack function.  
@@ -367,45 +409,53 @@ def calcSparseVelocity(img1, img2, mask, calib=None, homog=None,
     :param min_features: Minimum number of seeded points to track, default to 4
     :type min_features: int, optional
     :param seedparams: Point seeding parameters, which indicate whether points are generated based on corner features or a grid with defined spacing. The three corner features parameters denote maximum number of corners detected, corner quality, and minimum distance between corners; inputted as a list. For grid generation, the only input parameter needed is the grid spacing; inputted as a list containing the horizontal and vertical grid spacing. Default to [50000, 0.1, 5.0]
-    :type seedparams: list, optional                           
+    :type seedparams: list, optional
+    :param newMat: Precomputed optimal camera matrix, calculated from the calibration parameters if not given; default to None
+    :type newMat: arr, optional
+    :param prevpts: Points to track, given as an array of shape (n,1,2). If given, these are tracked instead of seeding new points in image 1, which allows surviving tracks from a previous image pair to be continued without re-running the corner detector; default to None
+    :type prevpts: arr, optional
     :returns: Two lists, 1. The xyz velocities for each point (xyz[0]), the xyz positions for the points in the first image (xyz[1]), and the xyz positions for the points in the second image(xyz[2]); 2. The uv velocities for each point (uv[0], the uv positions for the points in the first image (uv[1]), the uv positions for the points in the second image (uv[2]), and the corrected uv points in the second image if they have been calculated using the homography model for image registration (uv[3]). If the corrected points have not been calculated then an empty list is merely returned 
     :rtype: list                                
     """      
     #Set threshold difference for homography correction
     displacement_tolerance_rel=2.0
     
-    #Seed features
-    p0 = seedCorners(img1, mask, seedparams[0], seedparams[1], 
-                     seedparams[2], min_features)
-    
+    #Seed features, unless points carried over from a previous pair have
+    #been supplied, in which case the corner detector is skipped
+    if prevpts is not None and prevpts.shape[0]>=min_features:
+        p0 = prevpts
+    else:
+        p0 = seedCorners(img1, mask, seedparams[0], seedparams[1],
+                         seedparams[2], min_features)
+
     #Track points between the image pair
-    points, ptserrors = opticalMatch(img1, img2, p0, winsize, back_thresh,  
-                                     min_features) 
- 
+    points, ptserrors = opticalMatch(img1, img2, p0, winsize, back_thresh,
+                                     min_features)
+
     #Pass empty object if tracking was insufficient
-    if points==None:
+    if points is None:
         print('\nNo features to undertake velocity measurements')
         return None        
         
-    if calib is not None:        
-        #Calculate optimal camera matrix 
-        size=img1.shape
-        h = size[0]
-        w = size[1]
-        newMat, roi = cv2.getOptimalNewCameraMatrix(calib[0], 
-                                                    calib[1], 
-                                                    (w,h), 1, (w,h))
-        
-        #Correct tracked points for image distortion. The displacement here 
-        #is defined forwards (i.e. the points in image 1 are first 
-        #corrected, followed by those in image 2)      
-        #Correct points in first image 
-        src_pts_corr=cv2.undistortPoints(points[0],calib[0],calib[1],P=newMat)
-        
-        #Correct points in second image                                         
-        dst_pts_corr=cv2.undistortPoints(points[1],calib[0],calib[1],P=newMat)
-        
-        back_pts_corr=cv2.undistortPoints(points[2],calib[0],calib[1],P=newMat)
+    if calib is not None:
+        #Calculate optimal camera matrix, unless a precomputed one has
+        #been passed in by the caller (it is constant across a sequence)
+        if newMat is None:
+            size=img1.shape
+            h = size[0]
+            w = size[1]
+            newMat, roi = _optimalCamMatrix(calib[0], calib[1], w, h)
+
+        #Correct tracked points for image distortion. The source, tracked
+        #and back-tracked point sets are concatenated and corrected with a
+        #single undistortPoints call, then split back apart, so the
+        #iterative distortion solver runs once rather than three times
+        n=points[0].shape[0]
+        all_pts=np.concatenate((points[0], points[1], points[2]), axis=0)
+        all_corr=cv2.undistortPoints(all_pts,calib[0],calib[1],P=newMat)
+        src_pts_corr=all_corr[0:n]
+        dst_pts_corr=all_corr[n:2*n]
+        back_pts_corr=all_corr[2*n:]
 
     else:
         src_pts_corr = points[0]
@@ -424,26 +474,31 @@ def calcSparseVelocity(img1, img2, mask, calib=None, homog=None,
                                                   inverse=True)
         
         #Calculate difference between points corrected for homography and
-        #those uncorrected for homography
-        dispx=dst_pts_homog[:,0,0]-src_pts_corr[:,0,0]
-        dispy=dst_pts_homog[:,0,1]-src_pts_corr[:,0,1]
-        
-        #Use pythagoras' theorem to obtain distance
-        disp_dist=np.sqrt(dispx*dispx+dispy*dispy)
-        
-        #Determine threshold for good points using a given displacement 
+        #those uncorrected for homography. Distances are compared squared
+        #against the squared threshold, which avoids the sqrt over all
+        #points with an identical result
+        disp=dst_pts_homog[:,0,:]-src_pts_corr[:,0,:]
+        disp_dist_sq=np.einsum('ij,ij->i', disp, disp)
+
+        #Determine threshold for good points using a given displacement
         #tolerance (defined earlier)
         xsd=hpts[0][2]
         ysd=hpts[0][3]
-        sderr=math.sqrt(xsd*xsd+ysd*ysd)
-        good=disp_dist > sderr * displacement_tolerance_rel
-        
-        #Keep good points
-        src_pts_corr=src_pts_corr[good]
-        dst_pts_corr=dst_pts_corr[good]
-        dst_pts_homog=dst_pts_homog[good]
-        back_pts_corr=back_pts_corr[good]
-        ptserrors=ptserrors[good]
+        sderr_sq=xsd*xsd+ysd*ysd
+        good=disp_dist_sq > sderr_sq * (displacement_tolerance_rel ** 2)
+
+        #Keep good points, resolving the boolean mask to indices once and
+        #gathering all five arrays with the same index. Pass empty object
+        #if too few points survive the tolerance filter
+        idx=np.flatnonzero(good)
+        if idx.shape[0] < min_features:
+            print('Not enough points remaining after homography correction')
+            return None
+        src_pts_corr=src_pts_corr[idx]
+        dst_pts_corr=dst_pts_corr[idx]
+        dst_pts_homog=dst_pts_homog[idx]
+        back_pts_corr=back_pts_corr[idx]
+        ptserrors=ptserrors[idx]
         
         print(str(dst_pts_corr.shape[0]) + 
               ' points remaining after homography correction')
@@ -453,37 +508,29 @@ def calcSparseVelocity(img1, img2, mask, calib=None, homog=None,
         print('Homography matrix not supplied. Original tracked points kept')
         dst_pts_homog=dst_pts_corr
     
-    #Calculate pixel velocity
-    pxvel=[]       
-    for c,d in zip(src_pts_corr, dst_pts_homog):                        
-        pxvel.append(np.sqrt((d[0][0]-c[0][0])*(d[0][0]-c[0][0])+
-                     (d[0][1]-c[0][1])*(d[0][1]-c[0][1])))
-        
-    #Project good points (original and tracked) to obtain XYZ coordinates
-    if invprojvars is not None:        
-        #Project good points from image0
-        uvs=src_pts_corr[:,0,:]
-        xyzs=projectUV(uvs, invprojvars)
-        
-        #Project good points from image1
-        uvd=dst_pts_homog[:,0,:]
-        xyzd=projectUV(uvd, invprojvars)
+    #Calculate pixel velocity over all points in one vectorised pass
+    pxdiff=dst_pts_homog[:,0,:]-src_pts_corr[:,0,:]
+    pxvel=np.sqrt(np.einsum('ij,ij->i', pxdiff, pxdiff))
 
-        #Project good points from image0 back-tracked
-        uvb=back_pts_corr[:,0,:]
-        xyzb=projectUV(uvb, invprojvars)
-        
-        #Calculate xyz velocity
-        xyzvel=[]
-        for a,b in zip(xyzs, xyzd):                        
-            xyzvel.append(np.sqrt((b[0]-a[0])*(b[0]-a[0])+
-                         (b[1]-a[1])*(b[1]-a[1])))
-        
-        #Calculate xyz error
-        xyzerr=[]
-        for a,b in zip(xyzs, xyzb):
-            xyzerr.append(np.sqrt((b[0]-a[0])*(b[0]-a[0])+
-                         (b[1]-a[1])*(b[1]-a[1])))
+    #Project good points (original, tracked and back-tracked) to obtain XYZ
+    #coordinates, stacking all three point sets into one projectUV call so
+    #the DEM interpolation is only set up once
+    if invprojvars is not None:
+        n=src_pts_corr.shape[0]
+        all_uv=np.concatenate((src_pts_corr[:,0,:], dst_pts_homog[:,0,:],
+                               back_pts_corr[:,0,:]), axis=0)
+        all_xyz=projectUV(all_uv, invprojvars)
+        xyzs=all_xyz[0:n]
+        xyzd=all_xyz[n:2*n]
+        xyzb=all_xyz[2*n:]
+
+        #Calculate xyz velocity from the planar point displacements
+        xyzdiff=xyzd[:,0:2]-xyzs[:,0:2]
+        xyzvel=np.sqrt(np.einsum('ij,ij->i', xyzdiff, xyzdiff))
+
+        #Calculate xyz error from the back-tracked displacements
+        xyzbdiff=xyzb[:,0:2]-xyzs[:,0:2]
+        xyzerr=np.sqrt(np.einsum('ij,ij->i', xyzbdiff, xyzbdiff))
     else:
         xyzs=None
         xyzd=None
@@ -501,9 +548,9 @@ def calcSparseVelocity(img1, img2, mask, calib=None, homog=None,
                 [pxvel, src_pts_corr, dst_pts_corr, None, ptserrors]]
         
 
-def calcDenseVelocity(im0, im1, griddistance, method, templatesize, 
-                      searchsize, mask, calib=None, homog=None, campars=None, 
-                      threshold= 0.8, min_features=4):
+def calcDenseVelocity(im0, im1, griddistance, method, templatesize,
+                      searchsize, mask, calib=None, homog=None, campars=None,
+                      threshold= 0.8, min_features=4, newMat=None):
     """Function to calculate the velocity between a pair of images using 
     a gridded template matching approach. Gridded points are defined by grid 
     distance, which are then used to either generate templates for matching
@@ -541,6 +588,8 @@ def calcDenseVelocity(im0, im1, griddistance, method, templatesize,
     :type threshold: int, optional
     :param min_features: Minimum number of seeded points to track, default to 4
     :type min_features: int, optional
+    :param newMat: Precomputed optimal camera matrix, calculated from the calibration parameters if not given; default to None
+    :type newMat: arr, optional
     :returns: Two lists, 1. containing the xyz velocities for each point (xyz[0]), the xyz positions for the points in the first image (xyz[1]), and the  xyz positions for the points in the second image(xyz[2]); amd 2. containing the uv velocities for each point (uv[0], the uv positions for the points in the first image (uv[1]), the uv positions for the points in the second image (uv[2]), and the corrected uv points in the second image if they have been calculated using the homography model for image registration (uv[3]). If the corrected points have not been calculated then an empty list is merely returned 
     :rtype: list                                
     """       
@@ -557,33 +606,30 @@ def calcDenseVelocity(im0, im1, griddistance, method, templatesize,
                                    threshold, min_features, method)
  
     #Pass empty object if tracking was insufficient
-    if pts==None:
+    if pts is None:
         print('\nNo features to undertake velocity measurements')
         return None        
     
-    #Correct point tracks for camera distortion    
-    if calib is not None: 
-        
-        #Calculate optimal camera matrix 
-        size=im0.shape
-        h = size[0]
-        w = size[1]
-        newMat, roi = cv2.getOptimalNewCameraMatrix(calib[0], 
-                                                    calib[1], 
-                                                    (w,h), 1, (w,h))
-        
-        #Correct tracked points for image distortion. The displacement here 
-        #is defined forwards (i.e. the points in image 1 are first 
-        #corrected, followed by those in image 2)      
-        #Correct points in first image 
-        src_pts_corr=cv2.undistortPoints(pts[0], 
-                                         calib[0], 
-                                         calib[1],P=newMat)
-        
-        #Correct points in second image                                         
-        dst_pts_corr=cv2.undistortPoints(pts[1], 
-                                         calib[0], 
-                                         calib[1],P=newMat)
+    #Correct point tracks for camera distortion
+    if calib is not None:
+
+        #Calculate optimal camera matrix, unless a precomputed one has
+        #been passed in by the caller (it is constant across a sequence)
+        if newMat is None:
+            size=im0.shape
+            h = size[0]
+            w = size[1]
+            newMat, roi = _optimalCamMatrix(calib[0], calib[1], w, h)
+
+        #Correct tracked points for image distortion. The displacement here
+        #is defined forwards (i.e. the points in image 1 are first
+        #corrected, followed by those in image 2). Both point sets are
+        #stacked into a single undistortPoints call and split back apart
+        n=pts[0].shape[0]
+        all_pts=np.concatenate((pts[0], pts[1]), axis=0)
+        all_corr=cv2.undistortPoints(all_pts, calib[0], calib[1], P=newMat)
+        src_pts_corr=all_corr[0:n]
+        dst_pts_corr=all_corr[n:]
     
     #Return uncorrected points if calibration not given        
     else:
@@ -603,26 +649,32 @@ def calcDenseVelocity(im0, im1, griddistance, method, templatesize,
                                                   inverse=True)
         
         #Calculate difference between points corrected for homography and
-        #those uncorrected for homography
-        dispx=dst_pts_homog[:,0,0]-src_pts_corr[:,0,0]
-        dispy=dst_pts_homog[:,0,1]-src_pts_corr[:,0,1]
-        
-        #Use pythagoras' theorem to obtain distance
-        disp_dist=np.sqrt(dispx*dispx+dispy*dispy)
-        
-        #Determine threshold for good points using a given displacement 
+        #those uncorrected for homography. Distances are compared squared
+        #against the squared threshold, which avoids the sqrt over all
+        #points with an identical result
+        disp=dst_pts_homog[:,0,:]-src_pts_corr[:,0,:]
+        disp_dist_sq=np.einsum('ij,ij->i', disp, disp)
+
+        #Determine threshold for good points using a given displacement
         #tolerance (defined earlier)
         xsd=hpts[0][2]
         ysd=hpts[0][3]
-        sderr=math.sqrt(xsd*xsd+ysd*ysd)
-        good=disp_dist > sderr * displacement_tolerance_rel
-        
-        #Keep good points
-        src_pts_corr=src_pts_corr[good]
-        dst_pts_corr=dst_pts_corr[good]
-        dst_pts_homog=dst_pts_homog[good]
-        ptserrors=ptserrors[good]            
-        
+        sderr_sq=xsd*xsd+ysd*ysd
+        good=disp_dist_sq > sderr_sq * (displacement_tolerance_rel ** 2)
+
+        #Keep good points, resolving the boolean mask to indices once and
+        #gathering all arrays with the same index. Pass empty object if
+        #too few points survive the tolerance filter
+        idx=np.flatnonzero(good)
+        if idx.shape[0] < min_features:
+            print('Not enough points remaining after homography correction')
+            return None
+        src_pts_corr=src_pts_corr[idx]
+        dst_pts_corr=dst_pts_corr[idx]
+        dst_pts_homog=dst_pts_homog[idx]
+        ptserrors=ptserrors[idx]
+
+
         print(str(dst_pts_corr.shape[0]) + 
               ' points remaining after homography correction')
 
@@ -631,30 +683,26 @@ def calcDenseVelocity(im0, im1, griddistance, method, templatesize,
         print('Homography matrix not supplied. Original tracked points kept')
         dst_pts_homog=dst_pts_corr
     
-    #Calculate pixel velocity
-    pxvel=[]       
-    for c,d in zip(src_pts_corr, dst_pts_homog):                        
-        pxvel.append(np.sqrt((d[0][0]-c[0][0])*(d[0][0]-c[0][0])+
-                     (d[0][1]-c[0][1])*(d[0][1]-c[0][1])))
-        
-    #Project good points (original, tracked and back-tracked) to obtain XYZ 
-    #coordinates    
+    #Calculate pixel velocity over all points in one vectorised pass
+    pxdiff=dst_pts_homog[:,0,:]-src_pts_corr[:,0,:]
+    pxvel=np.sqrt(np.einsum('ij,ij->i', pxdiff, pxdiff))
+
+    #Project good points (original and tracked) to obtain XYZ
+    #coordinates
     if campars[2] is not None:
-        
+
         #Project good points from image0
         uvs=src_pts_corr[:,0,:]
         xyzs=projectUV(uvs, campars[2])
-        
+
         #Project good points from image1
         uvd=dst_pts_homog[:,0,:]
         xyzd=projectUV(uvd, campars[2])
-            
-        #Calculate xyz velocity
-        xyzvel=[]
-        for a,b in zip(xyzs, xyzd):                        
-            xyzvel.append(np.sqrt((b[0]-a[0])*(b[0]-a[0])+
-                         (b[1]-a[1])*(b[1]-a[1])))
-            
+
+        #Calculate xyz velocity from the planar point displacements
+        xyzdiff=xyzd[:,0:2]-xyzs[:,0:2]
+        xyzvel=np.sqrt(np.einsum('ij,ij->i', xyzdiff, xyzdiff))
+
     else:
         xyzs=None
         xyzd=None
@@ -671,9 +719,9 @@ def calcDenseVelocity(im0, im1, griddistance, method, templatesize,
                 [pxvel, src_pts_corr, dst_pts_corr, None, ptserrors]]
 
         
-def calcSparseHomography(img1, img2, mask, correct, method=cv2.RANSAC, 
-                         ransacReprojThreshold=5.0, winsize=(25,25), 
-                         back_thresh=1.0, min_features=4, 
+def calcSparseHomography(img1, img2, mask, correct, method=cv2.RANSAC,
+                         ransacReprojThreshold=5.0, winsize=(25,25),
+                         back_thresh=1.0, min_features=4,
                          seedparams=[50000, 0.1, 5.0]):
     """Function to supplement correction for movement in the camera 
     platform given an image pair (i.e. image registration). Returns the 
@@ -699,7 +747,7 @@ def calcSparseHomography(img1, img2, mask, correct, method=cv2.RANSAC,
     :param min_features: Minimum number of seeded points to track, default to 4
     :type min_features: int, optional
     :param seedparams: Point seeding parameters, which indicate whether points are generated based on corner features or a grid with defined spacing. The three corner features parameters denote maximum number of corners detected, corner quality, and minimum distance between corners; inputted as a list. For grid generation, the only input parameter needed is the grid spacing; inputted as a list containing the horizontal and vertical grid spacing. Default to [50000, 0.1, 5.0]
-    :type seedparams: list, optional                           
+    :type seedparams: list, optional
     :returns: homogMatrix (arr) - The calculated homographic shift for the image pair; src_pts_corr (arr) - original homography points; dst_pts_corr (arr) - tracked homography points; homog_pts (arr) -back-tracked homography points; ptserror (list) - Difference between the original homography points and the back-tracked points; homogerror (list) -Difference between the interpolated homography matrix and the equivalent tracked points
     :rtype: arr/list
     """          
@@ -708,11 +756,11 @@ def calcSparseHomography(img1, img2, mask, correct, method=cv2.RANSAC,
                      min_features)
         
     #Feature track between images
-    points, ptserrors = opticalMatch(img1, img2, p0, winsize, back_thresh, 
-                                     min_features) 
-        
+    points, ptserrors = opticalMatch(img1, img2, p0, winsize, back_thresh,
+                                     min_features)
+
     #Pass empty object if tracking insufficient
-    if points==None:
+    if points is None:
         print('\nNo features to undertake Homography')
         return None
     
@@ -722,22 +770,18 @@ def calcSparseHomography(img1, img2, mask, correct, method=cv2.RANSAC,
         size=img1.shape
         h = size[0]
         w = size[1]
-        newMat, roi = cv2.getOptimalNewCameraMatrix(correct[0], 
-                                                    correct[1], 
-                                                    (w,h), 1, (w,h))
+        newMat, roi = _optimalCamMatrix(correct[0], correct[1], w, h)
                
-        #Correct tracked points for image distortion. The homgraphy here is 
-        #defined forwards (i.e. the points in image 1 are first corrected, 
-        #followed by those in image 2)        
-        #Correct points in first image  
-        src_pts_corr=cv2.undistortPoints(points[0], 
-                                         correct[0], 
-                                         correct[1],P=newMat)
-        
-        #Correct tracked points in second image
-        dst_pts_corr=cv2.undistortPoints(points[1], 
-                                         correct[0], 
-                                         correct[1],P=newMat) 
+        #Correct tracked points for image distortion. The homgraphy here is
+        #defined forwards (i.e. the points in image 1 are first corrected,
+        #followed by those in image 2). Both point sets are stacked into a
+        #single undistortPoints call and split back apart
+        n=points[0].shape[0]
+        all_pts=np.concatenate((points[0], points[1]), axis=0)
+        all_corr=cv2.undistortPoints(all_pts, correct[0], correct[1],
+                                     P=newMat)
+        src_pts_corr=all_corr[0:n]
+        dst_pts_corr=all_corr[n:]
     else:
         src_pts_corr = points[0]
         dst_pts_corr = points[1]
@@ -817,7 +861,7 @@ def calcDenseHomography(img1, img2, mask, correct, griddistance, templatesize,
                                       threshold, min_features, trackmethod)
         
     #Pass empty object if tracking insufficient
-    if points==None:
+    if points is None:
         print('\nNo features to undertake Homography')
         return None
     
@@ -827,22 +871,18 @@ def calcDenseHomography(img1, img2, mask, correct, griddistance, templatesize,
         size=img1.shape
         h = size[0]
         w = size[1]
-        newMat, roi = cv2.getOptimalNewCameraMatrix(correct[0], 
-                                                    correct[1], 
-                                                    (w,h), 1, (w,h))
+        newMat, roi = _optimalCamMatrix(correct[0], correct[1], w, h)
                
-        #Correct tracked points for image distortion. The homgraphy here is 
-        #defined forwards (i.e. the points in image 1 are first corrected, 
-        #followed by those in image 2)        
-        #Correct points in first image  
-        src_pts_corr=cv2.undistortPoints(points[0], 
-                                         correct[0], 
-                                         correct[1],P=newMat)
-        
-        #Correct tracked points in second image
-        dst_pts_corr=cv2.undistortPoints(points[1], 
-                                         correct[0], 
-                                         correct[1],P=newMat) 
+        #Correct tracked points for image distortion. The homgraphy here is
+        #defined forwards (i.e. the points in image 1 are first corrected,
+        #followed by those in image 2). Both point sets are stacked into a
+        #single undistortPoints call and split back apart
+        n=points[0].shape[0]
+        all_pts=np.concatenate((points[0], points[1]), axis=0)
+        all_corr=cv2.undistortPoints(all_pts, correct[0], correct[1],
+                                     P=newMat)
+        src_pts_corr=all_corr[0:n]
+        dst_pts_corr=all_corr[n:]
     else:
         src_pts_corr = points[0]
         dst_pts_corr = points[1]
@@ -874,6 +914,37 @@ def calcDenseHomography(img1, img2, mask, correct, griddistance, templatesize,
             homogerrors)
     
 
+def _optimalCamMatrix(matrix, distort, w, h):
+    """Function to calculate the optimal new camera matrix for a given
+    calibration and image size. Results are memoised since the calibration
+    and image dimensions are constant across an image sequence, so only the
+    first call per sequence pays for the computation.
+
+    :param matrix: Camera matrix
+    :type matrix: arr
+    :param distort: Distortion coefficients
+    :type distort: arr
+    :param w: Image width
+    :type w: int
+    :param h: Image height
+    :type h: int
+    :returns: Optimal camera matrix (arr) and valid region of interest (tuple)
+    :rtype: tuple
+    """
+    return _optimalCamMatrixCached(
+        np.ascontiguousarray(matrix, dtype=np.float64).tobytes(),
+        np.ascontiguousarray(distort, dtype=np.float64).tobytes(), w, h)
+
+
+@lru_cache(maxsize=8)
+def _optimalCamMatrixCached(mtx_bytes, dist_bytes, w, h):
+    """Cached worker for _optimalCamMatrix, keyed on the byte contents of
+    the camera matrix and distortion coefficients."""
+    mtx=np.frombuffer(mtx_bytes).reshape(3,3)
+    dist=np.frombuffer(dist_bytes)
+    return cv2.getOptimalNewCameraMatrix(mtx, dist, (w,h), 1, (w,h))
+
+
 def apply_persp_homographyPts(pts, homog, inverse=False):        
     """Funtion to apply a perspective homography to a sequence of 2D 
     values held in X and Y. The perspective homography is represented as a 
@@ -890,37 +961,29 @@ def apply_persp_homographyPts(pts, homog, inverse=False):
     :returns: corrected point positions
     :rtype: arr
     """
-    #If input is array         
+    #If input is array
     if isinstance(pts,np.ndarray):
-        n=pts.shape[0]
-        hpts=np.zeros(pts.shape)
-       
         if inverse:
-           val,homog=cv2.invert(homog)       
-        
-        for i in range(n):
-            div=1./(homog[2][0]*pts[i][0][0] + homog[2][1]*pts[i][0][1] + 
-                    homog[2][2])
-            hpts[i][0][0]=((homog[0][0]*pts[i][0][0] + 
-                           homog[0][1]*pts[i][0][1] + homog[0][2])*div)
-            hpts[i][0][1]=((homog[1][0]*pts[i][0][0] + 
-                            homog[1][1]*pts[i][0][1] + homog[1][2])*div)                          
-        return hpts 
+           val,homog=cv2.invert(homog)
+
+        #Apply the homography to all points with one matmul on the
+        #homogeneous coordinates, then normalise by the projective row.
+        #The matrix is cast to the dtype of the points so the float32
+        #arrays coming out of OpenCV tracking are not silently promoted
+        #to float64 through the pipeline
+        xy=pts.reshape(-1,2)
+        hom=np.ones((xy.shape[0],3), dtype=xy.dtype)
+        hom[:,0:2]=xy
+        vecs=hom@np.transpose(homog).astype(xy.dtype, copy=False)
+        hpts=vecs[:,0:2]/vecs[:,2:3]
+        return hpts.reshape(pts.shape)
     
-    #If input is as list
+    #If input is as list, correct through the same vectorised array path
+    #and convert back, rather than looping over the points in Python
     elif isinstance(pts, list):
-        hpts=[]
-               
-        if inverse:
-            val,homog=cv2.invert(homog) 
-
-        for p in pts:
-            div=1./(homog[2][0]*p[0]+homog[2][1]*p[1]+homog[2][2])
-            xh=(homog[0][0]*p[0]+homog[0][1]*p[1]+homog[0][2])*div
-            yh=(homog[1][0]*p[0]+homog[1][1]*p[1]+homog[1][2])*div
-            hpts.append([xh,yh])
-        
-        return hpts
+        hpts=apply_persp_homographyPts(np.asarray(pts, dtype=np.float64),
+                                       homog, inverse)
+        return hpts.tolist()
     
     #If input is incompatible
     else:
@@ -930,6 +993,38 @@ def apply_persp_homographyPts(pts, homog, inverse=False):
         return hpts 
         
 
+def _pyrLK(im0, im1, pts, lk_params):
+    """Run pyramidal Lucas Kanade tracking over a point set. Small sets are
+    tracked with a single calcOpticalFlowPyrLK call; large sets are split
+    into chunks tracked concurrently on a thread pool, since each point is
+    tracked independently given the (shared, read-only) images and OpenCV
+    releases the GIL during the call.
+
+    :param im0: Image to track from
+    :type im0: arr
+    :param im1: Image to track to
+    :type im1: arr
+    :param pts: Points to track, given as an array of shape (n,1,2)
+    :type pts: arr
+    :param lk_params: Keyword parameters for calcOpticalFlowPyrLK
+    :type lk_params: dict
+    :returns: Tracked points, status flags and tracking errors
+    :rtype: tuple
+    """
+    chunksize=10000
+    if pts.shape[0]<=chunksize:
+        return cv2.calcOpticalFlowPyrLK(im0, im1, pts, None, **lk_params)
+    chunks=[pts[i:i+chunksize] for i in range(0, pts.shape[0], chunksize)]
+    def trackchunk(chunk):
+        return cv2.calcOpticalFlowPyrLK(im0, im1, chunk, None, **lk_params)
+    with ThreadPoolExecutor() as executor:
+        results=list(executor.map(trackchunk, chunks))
+    p=np.concatenate([r[0] for r in results])
+    status=np.concatenate([r[1] for r in results])
+    error=np.concatenate([r[2] for r in results])
+    return p, status, error
+
+
 def opticalMatch(i0, iN, p0, winsize, back_thresh, min_features):
     """Function to match between two masked images using Optical Flow. The 
     Lucas Kanade optical flow algorithm is applied using the OpenCV function 
@@ -948,39 +1043,38 @@ def opticalMatch(i0, iN, p0, winsize, back_thresh, min_features):
     :param back_thesh: Threshold for back-tracking distance (i.e. the difference between the original seeded point and the back-tracked point in im0)
     :type back_thresh: int
     :param min_features: Minimum number of seeded points to track
-    :type min_features: int   
+    :type min_features: int
     :return: Point coordinates for points tracked to image 2 (arr), Point coordinates for points back-tracked from image 2 to image 1 (arr), and SNR measurements for the corresponding tracked point. The signal is the magnitude of the displacement from p0 to p1, and the noise is the magnitude of the displacement from p0r to p0 (arr)
     :rtype: arr
     """
     #Feature tracking set-up parameters
     lk_params = dict( winSize  = winsize,
                       maxLevel = 2,
-                      criteria = (cv2.TERM_CRITERIA_EPS | 
+                      criteria = (cv2.TERM_CRITERIA_EPS |
                                   cv2.TERM_CRITERIA_COUNT, 10, 0.03))
-        
+
     #Track forward from im0 to im1. p1 is returned as an array of shape
     #(n,1,2), where n is the number of features tracked
-    p1, status1, error1  = cv2.calcOpticalFlowPyrLK(i0, iN, p0, 
-                                                    None, **lk_params) 
-                                                    
+    p1, status1, error1  = _pyrLK(i0, iN, p0, lk_params)
+
     #Track backwards from im1 to im0 using the forward-tracked points
-    p0r, status0, error0  = cv2.calcOpticalFlowPyrLK(iN, i0, p1, 
-                                                     None, **lk_params)         
+    p0r, status0, error0  = _pyrLK(iN, i0, p1, lk_params)
    
-    #Find euclidian pixel distance beween original(p0) and backtracked 
-    #(p0r) points and discard point greater than the threshold. This is 
+    #Find euclidian pixel distance beween original(p0) and backtracked
+    #(p0r) points and discard point greater than the threshold. This is
     #a way of checking tracking robustness
-    dist=(p0-p0r)*(p0-p0r)
-    dist=np.sqrt(dist[:,0,0]+dist[:,0,1])            
+    d=(p0-p0r).reshape(-1,2)
+    dist=np.sqrt(np.einsum('ij,ij->i', d, d))
     tracked=len(dist)
-    good = dist < back_thresh
-    
-    #Points are boolean filtered by the backtracking success 
-    p0=p0[good]
-    p1=p1[good]
-    p0r=p0r[good]
-    error=dist[good]
-    print('Average back-tracking difference: ' + str(np.mean(good)))
+
+    #Points are filtered by the backtracking success, resolving the
+    #threshold mask to indices once for all four gathers
+    idx=np.flatnonzero(dist < back_thresh)
+    p0=p0[idx]
+    p1=p1[idx]
+    p0r=p0r[idx]
+    error=dist[idx]
+    print('Average back-tracking difference: ' + str(np.mean(error)))
 
     #Return None if number of tracked features is under the 
     #min_features threshold
@@ -994,6 +1088,80 @@ def opticalMatch(i0, iN, p0, winsize, back_thresh, min_features):
     return [p0,p1,p0r], error
 
 
+def _matchTemplate(u, v, im0, im1, templatesize, searchsize, meth, takemin,
+                   threshold):
+    """Match the template around one seed point of im0 to its search window
+    in im1, refining the correlation peak to sub-pixel precision with a
+    parabola fitted to the 3x3 neighbourhood of the integer peak. Returns
+    (u, v, loc_x, loc_y, meancorr) for a successful match, or None if the
+    match failed or the mean correlation fell below the threshold.
+
+    :param u: Seed point column in im0
+    :type u: int
+    :param v: Seed point row in im0
+    :type v: int
+    :param im0: Image 1 in the image pair, as uint8
+    :type im0: arr
+    :param im1: Image 2 in the image pair, as uint8
+    :type im1: arr
+    :param templatesize: Template window size in im0 for matching
+    :type templatesize: int
+    :param searchsize: Search window size in im1 for matching
+    :type searchsize: int
+    :param meth: OpenCV template matching method constant
+    :type meth: int
+    :param takemin: Flag denoting whether the best match is the minimum of the correlation surface (square-difference methods)
+    :type takemin: bool
+    :param threshold: Mean correlation threshold for retaining the match
+    :type threshold: int
+    :returns: Matched point information, or None
+    :rtype: tuple
+    """
+    #Get template and search window for point
+    template = im0[int(v-(templatesize/2)):int(v+(templatesize/2)),
+                  int(u-(templatesize/2)):int(u+(templatesize/2))]
+    search = im1[int(v-(searchsize/2)):int(v+(searchsize/2)),
+                int(u-(searchsize/2)):int(u+(searchsize/2))]
+
+    #Attempt to match template in imageA to search window in imageB
+    try:
+        resz = cv2.matchTemplate(search, template, meth)
+    except:
+        return None
+
+    #Get correlation values and coordinate locations
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(resz)
+    if takemin:
+        location = min_loc
+    else:
+        location = max_loc
+
+    #Refine the peak to sub-pixel precision with a parabola fitted to the
+    #3x3 neighbourhood of the integer peak
+    lx,ly = location
+    dx = 0.
+    dy = 0.
+    if 0 < lx < resz.shape[1]-1:
+        denom = resz[ly,lx-1]-2*resz[ly,lx]+resz[ly,lx+1]
+        if denom != 0:
+            dx = 0.5*(resz[ly,lx-1]-resz[ly,lx+1])/denom
+    if 0 < ly < resz.shape[0]-1:
+        denom = resz[ly-1,lx]-2*resz[ly,lx]+resz[ly+1,lx]
+        if denom != 0:
+            dy = 0.5*(resz[ly-1,lx]-resz[ly+1,lx])/denom
+
+    #Reject point if mean correlation value is below threshold
+    meancorr = np.mean(resz)
+    if meancorr <= threshold:
+        return None
+
+    #Calculate tracked point location, assuming the origin of the template
+    #window is the same as the origin of the correlation array
+    loc_x = (u - (resz.shape[1]/2)) + lx + dx
+    loc_y = (v - (resz.shape[0]/2)) + ly + dy
+    return (u, v, loc_x, loc_y, meancorr)
+
+
 def templateMatch(im0, im1, uv0, templatesize, searchsize, threshold=0.8,
                   min_features=4, method=cv2.TM_CCORR_NORMED):
     """Function to template match between two images. Templates in the first
@@ -1021,82 +1189,41 @@ def templateMatch(im0, im1, uv0, templatesize, searchsize, threshold=0.8,
     :returns: Point coordinates for points tracked to image 2 (arr), Point coordinates for points back-tracked from image 2 to image 1 (arr), and SNR measurements for the corresponding tracked point where the signal is the magnitude of the displacement from p0 to p1, and the noise is the magnitude of the displacement from p0r to p0 (arr)
     :rtype: arr
     """
-    #Create empty outputs
+    #Change array values from float64 to uint8 once for both images
+    im0 = im0.astype(np.uint8)
+    im1 = im1.astype(np.uint8)
+
+    #Define method string as mapping object
+    meth = eval(method) if isinstance(method, str) else method
+
+    #If the method is TM_SQDIFF or TM_SQDIFF_NORMED, the best match is the
+    #minimum of the correlation surface rather than the maximum
+    takemin = meth in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED)
+
+    #Match all templates concurrently. Each point is independent and
+    #cv2.matchTemplate releases the GIL, so the matching scales across
+    #cores with threads
+    def matchpoint(uv):
+        return _matchTemplate(uv[0], uv[1], im0, im1, templatesize,
+                              searchsize, meth, takemin, threshold)
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(matchpoint,
+                                    zip(uv0[:,:,0], uv0[:,:,1])))
+
+    #Gather successful matches, preserving seeding order
     avercorr=[]
     pu1=[]
     pv1=[]
     pu2=[]
-    pv2=[]        
-    
-    #Iterate through points
-    for u,v in zip(uv0[:,:,0], uv0[:,:,1]):
-         
-        #Get template and search window for point
-        template = im0[int(v-(templatesize/2)):int(v+(templatesize/2)), 
-                      int(u-(templatesize/2)):int(u+(templatesize/2))]
-        search = im1[int(v-(searchsize/2)):int(v+(searchsize/2)), 
-                    int(u-(searchsize/2)):int(u+(searchsize/2))]       
-               
-        #Change array values from float64 to uint8
-        template = template.astype(np.uint8)
-        search = search.astype(np.uint8)
-                      
-        #Define method string as mapping object
-        meth=eval(method)
-                   
-        #Attempt to match template in imageA to search window in imageB 
-        try:
-            resz = cv2.matchTemplate(search, template, meth)
-        except:
-            continue    
-                                        
-        #Create UV meshgrid for correlation result 
-        resx = np.arange(0, resz.shape[1], 1)
-        resy = np.arange(0, resz.shape[0], 1)                    
-        resx,resy = np.meshgrid(resx, resy, sparse=True)
-                                                
-        #Create bicubic interpolation grid                                                                            
-        interp = interpolate.interp2d(resx, resy, resz, kind='cubic')                    
-        
-        #Create sub-pixel UV grid to interpolate across
-        subpx = 0.01
-        newx = np.arange(0, resz.shape[1], subpx)
-        newy = np.arange(0, resz.shape[0], subpx)
-                
-        #Interpolate new correlation grid
-        resz = interp(newx, newy)
-                                                
-        #Get correlation values and coordinate locations        
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(resz)
-
-        #If the method is TM_SQDIFF or TM_SQDIFF_NORMED, take minimum 
-        #location
-        if method == 'cv2.TM_SQDIFF':                            
-            location = min_loc
-        elif method == 'cv2.TM_SQDIFF_NORMED':
-            location = min_loc
-            
-        #Else, take maximum location
-        else:                 
-            location = max_loc
-         
-        #Retain point if mean correlation value is above threshold
-        if np.mean(resz) > threshold:
-            
-            #Calculate tracked point location, assuming the origin of the 
-            #template window is the same as the origin of the correlation array                    
-            loc_x = ((u - ((resz.shape[1]*subpx)/2)) + 
-                    (location[0]*subpx))
-            loc_y = ((v - ((resz.shape[1]*subpx)/2) + 
-                    (location[1]*subpx)))                            
-        
-            #Retain correlation and location            
-            avercorr.append(np.mean(resz))
-            pu1.append(u)
-            pv1.append(v)
-            pu2.append(loc_x)
-            pv2.append(loc_y)
-            
+    pv2=[]
+    for result in results:
+        if result is not None:
+            pu1.append(result[0])
+            pv1.append(result[1])
+            pu2.append(result[2])
+            pv2.append(result[3])
+            avercorr.append(result[4])
+
             
     #Reshape all points and average correlations in 3D arrays
     uv0t = np.column_stack([pu1,pv1])
@@ -1152,6 +1279,28 @@ def seedCorners(im, mask, maxpoints, quality, mindist, min_features):
         return p0
 
 
+def _nearestIndex(axis, values):
+    """Find the indices of the nearest elements of a sorted 1-D axis for an
+    array of query values, using a vectorised binary search. Descending axes
+    are handled by searching the reversed axis and mapping the indices back.
+
+    :param axis: Sorted 1-D axis to search
+    :type axis: arr
+    :param values: Query values
+    :type values: arr
+    :returns: Index of the nearest axis element for each query value
+    :rtype: arr
+    """
+    axis=axis.ravel()
+    if axis.shape[0]>1 and axis[0]>axis[-1]:
+        return axis.shape[0]-1-_nearestIndex(axis[::-1], values)
+    idx=np.searchsorted(axis, values)
+    idx=np.clip(idx, 1, axis.shape[0]-1)
+    left=axis[idx-1]
+    right=axis[idx]
+    return np.where((values-left)<(right-values), idx-1, idx)
+
+
 def seedGrid(dem, griddistance, projvars, mask):
     """Define pixel grid at a specified grid distance, taking into 
     consideration the image size and image mask.
@@ -1178,45 +1327,32 @@ def seedGrid(dem, griddistance, projvars, mask):
     #Get DEM extent
     extent = dem.getExtent()
     
-    #Define point spacings in dem space
-    samplex = round((extent[1]-extent[0])/griddistance[0])
-    sampley = round((extent[3]-extent[2])/griddistance[1])
-    
-    #Define grid in dem space
-    linx = np.linspace(extent[0], extent[1], samplex)
-    liny = np.linspace(extent[2], extent[3], sampley)
-    
-    #Create mesh of grid points
-    meshx, meshy = np.meshgrid(linx, liny) 
-    
-    #Get unique DEM row and column values   
-    demx = dem.getData(0)    
-    demx_uniq = demx[0,:]
-    demx_uniq = demx_uniq.reshape(demx_uniq.shape[0],-1)    
-    demy = dem.getData(1)
-    demy_uniq = demy[:,0]    
-    demy_uniq = demy_uniq.reshape(demy_uniq.shape[0],-1)
-    
-    #Get Z values for mesh grid
-    meshx2 = []
-    meshy2 = []
-    meshz2 = []
-
-    #Go through all positions in mesh grid    
-    for a,b in zip(meshx.flatten(), meshy.flatten()):
-
-        #Find mesh grid point in DEM and return indexes
-        indx_x = (np.abs(demx_uniq-a)).argmin()
-        indx_y = (np.abs(demy_uniq-b)).argmin()
-
-        #Append Z value if not NaN (i.e. masked out in DEM)
-        if np.isnan(demz[indx_y,indx_x]) == False:
-            meshx2.append(a)
-            meshy2.append(b)
-            meshz2.append(demz[indx_y,indx_x])
-    
+    #Define grid axes in dem space at the requested spacing; arange keeps
+    #the point spacing at exactly griddistance rather than stretching a
+    #rounded number of samples over the extent
+    linx = np.arange(extent[0], extent[1], griddistance[0])
+    liny = np.arange(extent[2], extent[3], griddistance[1])
+
+    #Expand the axes to flat grid coordinates directly, without
+    #materialising full meshgrid arrays
+    gridx = np.tile(linx, liny.shape[0])
+    gridy = np.repeat(liny, linx.shape[0])
+
+    #Get unique DEM row and column values, cached on the raster
+    demx_uniq, demy_uniq = dem.getAxes()
+
+    #Find the nearest DEM cell for all grid points with a binary search
+    #over each 1-D grid axis, expanded to the flat grid the same way as
+    #the coordinates, and gather the Z values in one pass
+    indx_x = np.tile(_nearestIndex(demx_uniq, linx), liny.shape[0])
+    indx_y = np.repeat(_nearestIndex(demy_uniq, liny), linx.shape[0])
+    gridz = demz[indx_y, indx_x]
+
+    #Keep grid points with a valid Z value (i.e. not masked out in DEM)
+    valid = ~np.isnan(gridz)
+
     #Compile grid X, Y, Z components together
-    xyz=np.column_stack([meshx2,meshy2,meshz2])
+    xyz=np.column_stack([gridx[valid], gridy[valid], gridz[valid]])
 
     #Project xyz grid to image plane
     uv,depth,inframe = projectXYZ(projvars[0], projvars[1], projvars[2], 
@@ -1228,6 +1364,37 @@ def seedGrid(dem, griddistance, projvars, mask):
     
     return xyz, uv
 
+def rasteriseDEMmask(dem, polys):
+    """Rasterise one or more polygons in DEM coordinates to a boolean mask
+    over the DEM grid. The polygon vertices are mapped onto the grid through
+    the sorted DEM axes and all polygons are filled with a single OpenCV
+    polygon fill, so batching several regions against the same DEM costs one
+    raster pass.
+
+    :param dem: :class:`PyTrx.DEM.ExplicitRaster` DEM object
+    :type dem: arr
+    :param polys: Polygons to rasterise, each given as an array of XY vertices with shape (n,2)
+    :type polys: list
+    :returns: A Boolean mask with the same dimensions as the DEM, True inside any of the polygons
+    :rtype: arr
+    """
+    demx_uniq, demy_uniq = dem.getAxes()
+
+    #Map each polygon's vertices onto the DEM grid, rather than running a
+    #point-in-polygon test over every DEM cell
+    verts=[]
+    for xyz in polys:
+        cols = _nearestIndex(demx_uniq, xyz[:,0])
+        rows = _nearestIndex(demy_uniq, xyz[:,1])
+        verts.append(np.stack((cols, rows), axis=-1).astype(np.int32))
+
+    #Fill all polygons in one pass
+    demMask = np.zeros((demy_uniq.shape[0], demx_uniq.shape[0]),
+                       dtype=np.uint8)
+    cv2.fillPoly(demMask, verts, 1)
+    return demMask.astype(bool)
+
+
 def readDEMmask(dem, img, invprojvars, demMaskPath=None):
     """Read/generate DEM mask for subsequent grid generation. If a valid 
     filename is given then the DEM mask is loaded from file. If the filename
@@ -1253,14 +1420,14 @@ def readDEMmask(dem, img, invprojvars, demMaskPath=None):
     :rtype: arr
     """   
     #Check if a DEM mask already exists, if not enter digitising
-    if demMaskPath!=None:
-        try:
-            demMask = Image.open(demMaskPath)
-            demMask = np.array(demMask)
+    if demMaskPath is not None:
+        if os.path.exists(demMaskPath):
+            demMask = np.array(Image.open(demMaskPath))
             print('\nDEM mask loaded')
             return demMask
-        except:
-            print('\nDEM mask file not found. Proceeding to manually digitise...')
+        else:
+            print('\nDEM mask file not found. Proceeding to manually '
+                  'digitise...')
     
     #Open image in figure plot 
     fig=plt.gcf()
@@ -1282,30 +1449,18 @@ def readDEMmask(dem, img, invprojvars, demMaskPath=None):
     #Reshape array and project to DEM    
     uv = np.array(uv).reshape(-1,2)
     xyz = projectUV(uv, invprojvars)
-    xyz = np.column_stack([xyz[:,0], xyz[:,1]]) 
-    
-    #Get unique row and column data from DEM
-    demx = dem.getData(0)    
-    demx_uniq = demx[0,:]
-    demx_uniq = demx_uniq.reshape(demx_uniq.shape[0],-1)    
-    demy = dem.getData(1)
-    demy_uniq = demy[:,0] 
-    demy_uniq = demy_uniq.reshape(demy_uniq.shape[0],-1)
-    
-    #Create meshgrid of DEM XY coordinates
-    x, y = np.meshgrid(demx_uniq, demy_uniq)
-    x, y = x.flatten(), y.flatten()
-    points = np.vstack((x,y)).T
+    xyz = xyz[:,0:2]
     
-    #Overlay mask onto meshgrid and reshape as DEM
-    poly = path.Path(xyz)
-    demMask = poly.contains_points(points)
-    demMask = demMask.reshape((demy_uniq.shape[0], demx_uniq.shape[0]))
+    #Rasterise the digitised polygon onto the DEM grid
+    demMask = rasteriseDEMmask(dem, [xyz])
     
     #Save mask to file if file path is specified
-    if demMaskPath != None:
+    if demMaskPath is not None:
         try:
-            Image.fromarray(demMask).convert('L').save(demMaskPath)
+            #Scale the boolean mask to 0/255 with one vectorised multiply
+            #rather than PIL's mode conversion
+            Image.fromarray(demMask.view(np.uint8)*255, mode='L'
+                            ).save(demMaskPath)
             print('\nSaved DEM mask to: ' + str(demMaskPath))
         except:
             print('\nFailed to write file: ' + str(demMaskPath))